@@ -1,16 +1,50 @@
 """Central configuration for heartbeat obstacle detector system."""
 
 import os
+from typing import Final
 
 # Heartbeat interval in milliseconds
-HEARTBEAT_INTERVAL = int(os.getenv("HEARTBEAT_INTERVAL", "50"))
+HEARTBEAT_INTERVAL: Final[int] = int(os.getenv("HEARTBEAT_INTERVAL", "50"))
 
 # Timeout threshold for missing heartbeat in milliseconds
-TIMEOUT_THRESHOLD = int(os.getenv("TIMEOUT_THRESHOLD", "500"))
+TIMEOUT_THRESHOLD: Final[int] = int(os.getenv("TIMEOUT_THRESHOLD", "500"))
 
 # Host and port for heartbeat communication
-HEARTBEAT_HOST = os.getenv("HEARTBEAT_HOST", "localhost")
-HEARTBEAT_PORT = int(os.getenv("HEARTBEAT_PORT", "9999"))
+HEARTBEAT_HOST: Final[str] = os.getenv("HEARTBEAT_HOST", "localhost")
+HEARTBEAT_PORT: Final[int] = int(os.getenv("HEARTBEAT_PORT", "9999"))
+
+# Unix datagram socket path for same-host heartbeats (empty uses UDP host and port)
+HEARTBEAT_SOCKET_PATH: Final[str] = os.getenv("HEARTBEAT_SOCKET_PATH", "")
+
+# Kernel buffer size in bytes for the heartbeat sockets (0 keeps the OS default)
+SOCKET_BUFFER_SIZE: Final[int] = int(os.getenv("SOCKET_BUFFER_SIZE", str(1 << 20)))
+
+# Heartbeats drained per recvmmsg call on Linux (0 disables batched reception)
+HEARTBEAT_BATCH_SIZE: Final[int] = int(os.getenv("HEARTBEAT_BATCH_SIZE", "0"))
+
+# Stamp heartbeats with the kernel arrival time on Linux (0 uses the receive time)
+HEARTBEAT_KERNEL_TIMESTAMPS: Final[int] = int(
+    os.getenv("HEARTBEAT_KERNEL_TIMESTAMPS", "0")
+)
+
+# CPU core to pin the monitor (and the detectors it spawns) to on Linux (-1 disables)
+MONITOR_CPU: Final[int] = int(os.getenv("MONITOR_CPU", "-1"))
+
+# Poll the heartbeat socket in a busy loop instead of sleeping in select (0 disables)
+MONITOR_BUSY_WAIT: Final[int] = int(os.getenv("MONITOR_BUSY_WAIT", "0"))
+
+# Number of pre-started detectors kept waiting to replace a failed one (0 disables)
+WARM_STANDBY: Final[int] = int(os.getenv("WARM_STANDBY", "0"))
+
+# Time in milliseconds a detector gets to exit on SIGTERM before it is killed
+TERMINATE_TIMEOUT: Final[int] = int(os.getenv("TERMINATE_TIMEOUT", "5000"))
+
+# Environment flag that marks a spawned detector as a standby awaiting promotion
+STANDBY_ENV_VAR: Final[str] = "DETECTOR_STANDBY"
 
 # Default duration for monitoring and process manager in seconds
-DEFAULT_DURATION = int(os.getenv("DEFAULT_DURATION", "60"))
+DEFAULT_DURATION: Final[int] = int(os.getenv("DEFAULT_DURATION", "60"))
+
+# Rotating log file path (empty disables file logging) and minimum log level
+LOG_FILE: Final[str] = os.getenv("LOG_FILE", "")
+LOG_LEVEL: Final[str] = os.getenv("LOG_LEVEL", "INFO")
@@ -5,17 +5,30 @@ process while simulating obstacle detection. It uses UDP sockets for heartbeat c
 and includes failure simulation for testing fault detection.
 """
 
+import itertools
+import os
 import random
 import socket
+import struct
+import sys
 import time
-from datetime import datetime
-from typing import Optional
-
-from config import HEARTBEAT_HOST, HEARTBEAT_INTERVAL, HEARTBEAT_PORT
-from logger import get_logger
+from typing import Iterable, Optional, Tuple, Union
+
+from config import (
+    HEARTBEAT_HOST,
+    HEARTBEAT_INTERVAL,
+    HEARTBEAT_PORT,
+    HEARTBEAT_SOCKET_PATH,
+    SOCKET_BUFFER_SIZE,
+    STANDBY_ENV_VAR,
+)
+from logger import get_logger, stop_logging
 
 logger = get_logger(__name__)
 
+# Heartbeat wire format: one little-endian uint64 monotonic timestamp in nanoseconds.
+_HEARTBEAT_PACKET = struct.Struct("<Q")
+
 
 class ObstacleDetector:
     """Simulates an obstacle detection system with heartbeat monitoring.
@@ -27,19 +40,62 @@ class ObstacleDetector:
     Attributes:
         _heartbeat_interval (int): Interval between heartbeats in milliseconds.
         _heartbeat_socket (socket.socket): UDP socket for sending heartbeat messages.
-        _monitor_address (tuple): Tuple of (host, port) for the monitoring process.
+        _monitor_address (Union[str, tuple]): Tuple of (host, port) for the
+            monitoring process, or its Unix socket path when HEARTBEAT_SOCKET_PATH
+            is set. The socket is connected to it once, so each heartbeat is a
+            plain send.
+        _rng (random.Random): Private random generator driving the simulated
+            detection delays, distances, and failures.
+        _packet (bytearray): Heartbeat payload buffer, allocated once and
+            overwritten in place on every send.
+        _connected (bool): Whether the socket is connected to the monitor. A Unix
+            socket path that is not bound yet is connected on a later send.
     """
 
     def __init__(self) -> None:
         """Initializes the obstacle detector with default configuration.
 
         The detector is configured with a 50ms heartbeat interval and establishes
-        a UDP socket connection to the monitor process on localhost:9999.
+        a UDP socket connection to the monitor process on localhost:9999, or a
+        Unix datagram connection when HEARTBEAT_SOCKET_PATH is set. The socket is
+        non-blocking, so a monitor that stops reading costs dropped heartbeats
+        rather than a stalled detection loop.
         """
         self._heartbeat_interval = HEARTBEAT_INTERVAL  # milliseconds
-        self._heartbeat_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self._monitor_address = (HEARTBEAT_HOST, HEARTBEAT_PORT)
+        self._monitor_address: Union[str, Tuple[str, int]]
+        if HEARTBEAT_SOCKET_PATH and hasattr(socket, "AF_UNIX"):
+            family = socket.AF_UNIX
+            self._monitor_address = HEARTBEAT_SOCKET_PATH
+        else:
+            family = socket.AF_INET
+            self._monitor_address = (HEARTBEAT_HOST, HEARTBEAT_PORT)
+        self._heartbeat_socket = socket.socket(family, socket.SOCK_DGRAM)
+        # A full Unix datagram queue would otherwise block send()
+        self._heartbeat_socket.setblocking(False)
+        if SOCKET_BUFFER_SIZE:
+            self._heartbeat_socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE
+            )
         self._running = False
+        self._rng = random.Random()
+        self._packet = bytearray(_HEARTBEAT_PACKET.size)
+        self._connected = False
+        try:
+            self._connect()
+        except (FileNotFoundError, ConnectionRefusedError):
+            logger.info("Monitor socket %s not bound yet", self._monitor_address)
+
+    def _connect(self) -> None:
+        """Connect the heartbeat socket to the monitor address.
+
+        Resolving the address once here means each heartbeat is a plain send().
+
+        Raises:
+            FileNotFoundError: If the Unix socket path does not exist yet.
+            ConnectionRefusedError: If nothing is bound to the Unix socket path.
+        """
+        self._heartbeat_socket.connect(self._monitor_address)
+        self._connected = True
 
     def run_detection_loop(self, max_iterations: Optional[int] = None) -> None:
         """Runs the main detection loop.
@@ -48,25 +104,43 @@ class ObstacleDetector:
         1. Sends heartbeat signals
         2. Performs obstacle detection
         3. Simulates potential failures
-        4. Maintains the specified heartbeat interval
+        4. Sleeps until the next tick of a fixed heartbeat schedule
+
+        Ticks are scheduled on absolute monotonic deadlines, so time spent on
+        detection work does not stretch the heartbeat period. If an iteration
+        overruns its tick, the schedule is re-anchored instead of bursting to
+        catch up.
 
         Args:
             max_iterations (int, optional): Maximum number of loop iterations.
                 If None, runs indefinitely. Defaults to None.
         """
         self._running = True
-        iteration = 0
-
-        while self._running:
-            if max_iterations is not None:
-                if iteration >= max_iterations:
-                    break
-                iteration += 1
 
-            self.send_heartbeat()
-            self.detect_obstacles()
-            self.simulate_failure()
-            time.sleep(self._heartbeat_interval / 1000)
+        # Bind per-iteration callables once; the loop body only touches locals.
+        send = self.send_heartbeat
+        detect = self.detect_obstacles
+        fail = self.simulate_failure
+        sleep = time.sleep
+        monotonic = time.monotonic
+        interval = self._heartbeat_interval / 1000
+        iterations: Iterable[int] = (
+            itertools.count() if max_iterations is None else range(max_iterations)
+        )
+
+        next_tick = monotonic()
+        for _ in iterations:
+            if not self._running:
+                break
+            send()
+            detect()
+            fail()
+            next_tick += interval
+            delay = next_tick - monotonic()
+            if delay > 0:
+                sleep(delay)
+            else:
+                next_tick = monotonic()
 
     def stop(self) -> None:
         """Stops the detection loop gracefully."""
@@ -75,23 +149,42 @@ class ObstacleDetector:
     def send_heartbeat(self) -> None:
         """Sends a timestamped heartbeat message to the monitor process.
 
-        Creates and transmits a heartbeat message containing the current timestamp
-        via UDP to the configured monitor address.
+        Packs the current monotonic timestamp into the preallocated 8-byte
+        payload buffer and sends it on the heartbeat socket, which is connected to
+        the monitor address. A connected socket reports a monitor that is not
+        listening as ConnectionRefusedError (for UDP, on the send after the failed
+        delivery), so a refused heartbeat is dropped like any other lost datagram
+        and the socket reconnects on the next send. A heartbeat that finds the
+        monitor's queue full is dropped the same way.
         """
-        now = datetime.now()
-        message = now.strftime("%Y-%m-%d %H:%M:%S.%f")
-        self._heartbeat_socket.sendto(message.encode("utf-8"), self._monitor_address)
-        logger.info(f"Heartbeat sent at {now}")
+        now = time.monotonic_ns()
+        try:
+            if not self._connected:
+                self._connect()
+            _HEARTBEAT_PACKET.pack_into(self._packet, 0, now)
+            self._heartbeat_socket.send(self._packet)
+        except (ConnectionRefusedError, FileNotFoundError):
+            # A restarted monitor binds a new socket at the same Unix path
+            self._connected = False
+            logger.debug("Heartbeat at %d refused: monitor not listening", now)
+            return
+        except BlockingIOError:
+            logger.debug("Heartbeat at %d dropped: monitor queue full", now)
+            return
+        logger.debug("Heartbeat sent at %d", now)
 
     def simulate_failure(self) -> None:
         """Simulates random process failures for testing.
 
         Introduces a 1% chance of process termination on each call,
-        simulating unexpected crashes for fault tolerance testing.
+        simulating unexpected crashes for fault tolerance testing. The process
+        exits through os._exit() so the crash is abrupt: no atexit handlers or
+        interpreter finalization run, only the pending log records are flushed.
         """
-        if random.random() < 0.01:
+        if self._rng.random() < 0.01:
             logger.warning("Simulating a crash...")
-            exit(1)
+            stop_logging()
+            os._exit(1)
 
     def detect_obstacles(self) -> None:
         """Simulates obstacle detection with random delays and distances.
@@ -99,9 +192,22 @@ class ObstacleDetector:
         Mimics a real obstacle detection process by introducing random processing
         delays and generating random distance measurements.
         """
-        time.sleep(random.uniform(0.01, 0.03))
-        distance = random.uniform(1, 100)
-        logger.info(f"Detected obstacle at {distance:.2f} meters.")
+        uniform = self._rng.uniform
+        time.sleep(uniform(0.01, 0.03))
+        distance = uniform(1, 100)
+        logger.info("Detected obstacle at %.2f meters.", distance)
+
+
+def wait_for_promotion() -> bool:
+    """Block a standby detector until the process manager promotes it.
+
+    The process manager promotes a standby by writing a byte to its stdin pipe,
+    and retires it by closing the pipe.
+
+    Returns:
+        bool: True if the detector was promoted, False if it was retired.
+    """
+    return sys.stdin.buffer.read(1) != b""
 
 
 def main() -> None:  # pragma: no cover
@@ -110,6 +216,9 @@ def main() -> None:  # pragma: no cover
     Runs the detector independently for testing purposes.
     Use process_manager.py for complete system orchestration.
     """
+    if os.getenv(STANDBY_ENV_VAR) and not wait_for_promotion():
+        return
+
     logger.info("Starting ObstacleDetector in standalone mode...")
     logger.info(
         "Use 'python src/process_manager.py' for complete system orchestration."
@@ -123,7 +232,7 @@ def main() -> None:  # pragma: no cover
         logger.info("\nReceived interrupt signal. Stopping detector...")
         detector.stop()
     except Exception as e:
-        logger.error(f"Detector error: {e}")
+        logger.error("Detector error: %s", e)
         detector.stop()
 
 
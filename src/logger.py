@@ -1,21 +1,67 @@
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import List, Optional
 
-# Create logs directory if it doesn't exist
-if not os.path.exists("logs"):  # pragma: no cover
-    os.makedirs("logs")
+from config import LOG_FILE, LOG_LEVEL
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        RotatingFileHandler("logs/app.log", maxBytes=1024 * 1024 * 5, backupCount=5),
-        logging.StreamHandler(),
-    ],
-)
+_configured = False
+_listener: Optional[QueueListener] = None
+
+
+def _configure() -> None:
+    """Install the root queue handler and start its background listener.
+
+    Callers only enqueue records; file and console I/O run on the listener
+    thread. The rotating file handler is only created when LOG_FILE is set.
+    """
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    handlers: List[logging.Handler] = []
+    if LOG_FILE:
+        log_dir = os.path.dirname(LOG_FILE)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+        handlers.append(
+            RotatingFileHandler(LOG_FILE, maxBytes=1024 * 1024 * 5, backupCount=5)
+        )
+    handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    global _listener
+    _listener = QueueListener(log_queue, *handlers)
+
+    logging.basicConfig(
+        level=LOG_LEVEL,
+        format="%(message)s",
+        handlers=[QueueHandler(log_queue)],
+    )
+
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Flush queued log records and stop the background listener.
+
+    Registered with atexit, and safe to call directly before os._exit(), which
+    skips atexit handlers.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 
 def get_logger(name: str) -> logging.Logger:
+    global _configured
+    if not _configured:
+        _configure()
+        _configured = True
     return logging.getLogger(name)
@@ -5,19 +5,124 @@ from detector processes and coordinates with the ProcessManager for fault recove
 It focuses specifically on heartbeat detection and timeout management.
 """
 
+import contextlib
+import os
+import selectors
+import signal
 import socket
+import struct
+import sys
+import threading
 import time
-from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
-
-from config import DEFAULT_DURATION, HEARTBEAT_PORT, TIMEOUT_THRESHOLD
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional
+
+import batch_io
+from config import (
+    DEFAULT_DURATION,
+    HEARTBEAT_BATCH_SIZE,
+    HEARTBEAT_KERNEL_TIMESTAMPS,
+    HEARTBEAT_PORT,
+    HEARTBEAT_SOCKET_PATH,
+    MONITOR_BUSY_WAIT,
+    MONITOR_CPU,
+    SOCKET_BUFFER_SIZE,
+    TIMEOUT_THRESHOLD,
+)
 from logger import get_logger
 
 if TYPE_CHECKING:  # pragma: no cover
+    import subprocess
+
     from process_manager import ProcessManager
 
 logger = get_logger(__name__)
 
+# Where supported (Linux), the socket is created non-blocking in a single syscall.
+_SOCK_NONBLOCK = getattr(socket, "SOCK_NONBLOCK", 0)
+
+# Linux architectures whose SO_TIMESTAMPNS has the asm-generic value 35. Others
+# (SPARC, PA-RISC, Alpha) number it differently and must not guess.
+_GENERIC_SOCKOPT_MACHINES = (
+    "x86_64",
+    "i386",
+    "i486",
+    "i586",
+    "i686",
+    "aarch64",
+    "armv7l",
+    "armv6l",
+    "riscv64",
+    "ppc64le",
+    "ppc64",
+    "s390x",
+    "loongarch64",
+)
+
+
+def _so_timestampns() -> int:
+    """Return SO_TIMESTAMPNS, or 0 where its value is not known.
+
+    Also the type of the SCM_TIMESTAMPNS control message, whose payload is a
+    native struct timespec. Older socket modules do not export it, so the Linux
+    value is only assumed on architectures known to use it.
+
+    Returns:
+        int: The option number, or 0 if kernel timestamps cannot be requested.
+    """
+    value = getattr(socket, "SO_TIMESTAMPNS", 0)
+    if not value and sys.platform.startswith("linux"):
+        if os.uname().machine in _GENERIC_SOCKOPT_MACHINES:
+            value = 35
+    return int(value)
+
+
+_SO_TIMESTAMPNS = _so_timestampns()
+_TIMESPEC = struct.Struct("@ll")
+
+# Process descriptors (Linux 5.3+, Python 3.9+) become readable when the process exits.
+_pidfd_open = getattr(os, "pidfd_open", None)
+
+# Gives up the CPU between busy-wait polls; unavailable on Windows.
+_sched_yield = getattr(os, "sched_yield", None)
+
+# Signals that end monitoring early and shut the system down in order.
+_SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+def _wake_on_signal(signum: int, frame: Any) -> None:
+    """Handle a shutdown signal through the wakeup descriptor alone.
+
+    The interpreter writes the signal number to the wakeup descriptor before
+    running this handler, so there is nothing left to do here.
+
+    Args:
+        signum (int): Number of the received signal.
+        frame: Interrupted stack frame.
+    """
+
+
+def _read_shutdown_signals(reader: socket.socket) -> bool:
+    """Drain the signal wakeup socket and check it for shutdown signals.
+
+    The interpreter writes one byte per signal that has a Python handler, so
+    the socket can also carry signals that should not stop monitoring.
+
+    Args:
+        reader (socket.socket): Non-blocking read end of the wakeup socket pair.
+
+    Returns:
+        bool: True if SIGINT or SIGTERM was among the received signals.
+    """
+    requested = False
+    while True:
+        try:
+            data = reader.recv(64)
+        except BlockingIOError:
+            return requested
+        if not data:
+            return requested
+        requested = requested or any(num in _SHUTDOWN_SIGNALS for num in data)
+
 
 class HeartbeatMonitor:
     """Heartbeat monitoring service for detector processes.
@@ -28,45 +133,116 @@ class HeartbeatMonitor:
 
     Attributes:
         _timeout_threshold (int): Maximum time in milliseconds to wait for heartbeat.
-        _last_heartbeat (datetime): Timestamp of the last received heartbeat.
-        _heartbeat_socket (socket.socket): UDP socket for receiving heartbeat messages.
+        _timeout_ns (int): Timeout threshold converted to nanoseconds.
+        _last_heartbeat (int): Monotonic timestamp of the last heartbeat in nanoseconds.
+        _heartbeat_socket (socket.socket): Datagram socket for receiving heartbeat
+            messages. UDP by default, or a Unix socket bound to
+            HEARTBEAT_SOCKET_PATH, which skips the IP stack for same-host traffic.
+        _rx_buffer (bytearray): Preallocated buffer that heartbeat datagrams are read
+            into, so draining the socket does not allocate per packet.
+        _ancbufsize (int): Control message space for the kernel arrival timestamp,
+            or 0 when heartbeats are stamped with the receive time.
+        _batch_receiver (BatchReceiver): Optional ``recvmmsg`` drain used instead of
+            per-datagram reads when batching is enabled and supported.
+        _selector (selectors.BaseSelector): Readiness selector used to sleep in-kernel
+            until a heartbeat arrives, the worker exits, or the next deadline expires.
+        _worker_pidfd (int): Process descriptor of the current worker registered
+            with the selector, or None where pidfds are unavailable.
         _process_manager (ProcessManager): Reference to the main orchestrator.
         _duration (int): Total monitoring duration in seconds.
-        _start_time (float): Timestamp when monitoring began.
+        _start_time (int): Monotonic timestamp in nanoseconds when monitoring began,
+            0 until start_monitoring() is called.
     """
 
     # Type annotations for instance attributes
     _timeout_threshold: int
-    _last_heartbeat: Optional[datetime]
+    _timeout_ns: int
+    _last_heartbeat: int
     _heartbeat_socket: socket.socket
+    _rx_buffer: bytearray
+    _ancbufsize: int
+    _batch_receiver: Optional[batch_io.BatchReceiver]
+    _selector: selectors.BaseSelector
+    _worker_pidfd: Optional[int]
     _process_manager: Optional["ProcessManager"]
     _duration: int
-    _start_time: Optional[float]
+    _start_time: int
 
     def __init__(self, duration: int = 60) -> None:
         """Initialize the heartbeat monitor service.
 
         Sets up the UDP socket for receiving heartbeat messages and configures the
-        timeout threshold. The ProcessManager reference is set by the orchestrator.
+        timeout threshold. When MONITOR_CPU is set, the monitor is pinned to that
+        core. The ProcessManager reference is set by the orchestrator.
 
         Args:
             duration (int): Total monitoring duration in seconds. Defaults to 60.
         """
         self._timeout_threshold = TIMEOUT_THRESHOLD  # Timeout threshold in milliseconds
-        self._last_heartbeat = None
-        self._heartbeat_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self._heartbeat_socket.bind(("", HEARTBEAT_PORT))
-        self._heartbeat_socket.setblocking(False)
+        self._timeout_ns = self._timeout_threshold * 1_000_000
+        self._last_heartbeat = time.monotonic_ns()
+        if HEARTBEAT_SOCKET_PATH and hasattr(socket, "AF_UNIX"):
+            # A path left behind by a previous run would make bind() fail
+            if os.path.exists(HEARTBEAT_SOCKET_PATH):
+                os.unlink(HEARTBEAT_SOCKET_PATH)
+            self._heartbeat_socket = socket.socket(
+                socket.AF_UNIX, socket.SOCK_DGRAM | _SOCK_NONBLOCK
+            )
+            self._heartbeat_socket.bind(HEARTBEAT_SOCKET_PATH)
+        else:
+            self._heartbeat_socket = socket.socket(
+                socket.AF_INET, socket.SOCK_DGRAM | _SOCK_NONBLOCK
+            )
+            self._heartbeat_socket.bind(("", HEARTBEAT_PORT))
+        if SOCKET_BUFFER_SIZE:
+            # Room for heartbeats queued while a detector restart is in progress
+            self._heartbeat_socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE
+            )
+        if not _SOCK_NONBLOCK:
+            self._heartbeat_socket.setblocking(False)
+        self._rx_buffer = bytearray(16)
+        self._ancbufsize = 0
+        if HEARTBEAT_KERNEL_TIMESTAMPS and _SO_TIMESTAMPNS:
+            self._heartbeat_socket.setsockopt(socket.SOL_SOCKET, _SO_TIMESTAMPNS, 1)
+            self._ancbufsize = socket.CMSG_SPACE(_TIMESPEC.size)
+        elif HEARTBEAT_KERNEL_TIMESTAMPS:
+            logger.warning(
+                "HEARTBEAT_KERNEL_TIMESTAMPS ignored: SO_TIMESTAMPNS is not known here"
+            )
+        self._batch_receiver = None
+        if HEARTBEAT_BATCH_SIZE and batch_io.is_supported():
+            self._batch_receiver = batch_io.BatchReceiver(
+                self._heartbeat_socket, HEARTBEAT_BATCH_SIZE
+            )
+        self._selector = selectors.DefaultSelector()
+        if MONITOR_CPU >= 0 and hasattr(os, "sched_setaffinity"):
+            # Detectors spawned from here inherit the mask and share the core's cache
+            os.sched_setaffinity(0, {MONITOR_CPU})
+        self._worker_pidfd = None
         self._process_manager = None
         self._duration = duration or DEFAULT_DURATION
-        self._start_time = None
+        self._start_time = 0
 
     def start_monitoring(self, cmd: List[str]) -> None:
         """Start the monitoring loop for the detector process.
 
         Launches the detector process via the ProcessManager and begins continuous
-        monitoring of heartbeat signals. The monitoring loop runs for the specified
-        duration, coordinating with the ProcessManager for fault recovery.
+        monitoring of heartbeat signals. The loop blocks on the selector until a
+        heartbeat arrives, the timeout threshold expires, or the monitoring duration
+        ends, coordinating with the ProcessManager for fault recovery. Where the
+        worker can be watched through a pidfd, its exit wakes the selector too and
+        triggers the restart without waiting out the heartbeat timeout. The
+        monotonic clock is read once per wakeup and shared by the timeout and
+        duration checks.
+
+        With MONITOR_BUSY_WAIT enabled, the selector is polled without blocking
+        and the CPU is yielded between polls. This trades a fully busy core for
+        no wakeup latency.
+
+        SIGINT and SIGTERM received while monitoring wake the selector as well,
+        and end monitoring through the same shutdown path as the duration limit.
+        The previous signal handlers are restored before that shutdown starts.
 
         Args:
             cmd (List[str]): Command and arguments to start the detector process.
@@ -76,65 +252,255 @@ class HeartbeatMonitor:
                 "ProcessManager not set. Must be configured by orchestrator."
             )
 
-        self._process_manager.start_process(cmd)
-        self._last_heartbeat = datetime.now()
-        self._start_time = time.time()
-
-        while True:
-            if time.time() - self._start_time > self._duration:
-                logger.info("Monitoring duration reached. Shutting down.")
-                self._process_manager.shutdown_system()
-                break
-
-            self.receive_heartbeat()
-            if self.check_timeout():
-                logger.warning("Heartbeat timeout detected. Restarting process...")
-                self.restart_process()
-            time.sleep(0.1)
+        self._watch_worker(self._process_manager.start_process(cmd))
+        now_ns = self._start_time = self._last_heartbeat = time.monotonic_ns()
+        deadline_ns = self._start_time + self._duration * 1_000_000_000
+        self._selector.register(self._heartbeat_socket, selectors.EVENT_READ)
+
+        # Bind per-wakeup callables once; the loop body only touches locals.
+        select = self._selector.select
+        receive = self.receive_heartbeat
+        check_timeout = self.check_timeout
+        time_until_timeout = self.time_until_timeout
+        monotonic_ns = time.monotonic_ns
+        busy_wait = bool(MONITOR_BUSY_WAIT)
+        sched_yield = _sched_yield if busy_wait else None
+
+        with self._signal_wakeup() as wakeup:
+            while True:
+                remaining_ns = deadline_ns - now_ns
+                if remaining_ns < 0:
+                    logger.info("Monitoring duration reached. Shutting down.")
+                    break
+
+                if busy_wait:
+                    timeout = 0.0
+                else:
+                    timeout = min(time_until_timeout(now_ns), remaining_ns / 1e9)
+                events = select(timeout=timeout)
+                if not events and sched_yield is not None:
+                    sched_yield()
+                worker_exited = stop_requested = False
+                for key, _ in events:
+                    # Read the attribute each time: restarts replace the worker pidfd
+                    if key.fd == self._worker_pidfd:
+                        worker_exited = True
+                    elif key.fileobj is wakeup:
+                        stop_requested = _read_shutdown_signals(wakeup)
+                    else:
+                        receive()
+                if stop_requested:
+                    logger.info("Shutdown signal received. Shutting down.")
+                    break
+                now_ns = monotonic_ns()
+                if worker_exited:
+                    logger.warning("Detector process exited. Restarting process...")
+                    self.restart_process()
+                elif check_timeout(now_ns):
+                    logger.warning("Heartbeat timeout detected. Restarting process...")
+                    self.restart_process()
+
+            self._watch_worker(None)
+
+        # Shut down with the default handlers back, so a second Ctrl+C still
+        # interrupts a slow termination instead of being swallowed
+        self._process_manager.shutdown_system()
 
     def receive_heartbeat(self) -> None:
         """Receive and process incoming heartbeat messages.
 
-        Listens for UDP heartbeat messages from the detector process and updates
-        the last heartbeat timestamp when a message is successfully received.
-        Uses non-blocking socket operations to avoid hanging the monitoring loop.
+        Drains every UDP heartbeat message queued by the detector process until the
+        non-blocking socket reports no more data, then updates the last heartbeat
+        timestamp once. Queued datagrams therefore cost a single pass through the
+        monitoring loop instead of one iteration each. With batched reception
+        enabled, the queue is read with one ``recvmmsg`` call per batch.
+
+        With kernel timestamps enabled, the heartbeat time is the arrival time the
+        kernel recorded for the newest datagram, mapped onto the monotonic clock,
+        so scheduling delays between arrival and this call do not count towards
+        the timeout.
         """
-        try:
-            _, _ = self._heartbeat_socket.recvfrom(1024)
-            self._last_heartbeat = datetime.now()
-            logger.info(f"Heartbeat received at {self._last_heartbeat}")
-        except socket.error:
-            pass
+        received = False
+        arrival_ns: Optional[int] = None
+        if self._batch_receiver is not None:
+            received = self._batch_receiver.drain() > 0
+        else:
+            while True:
+                try:
+                    if self._ancbufsize:
+                        arrival_ns = self._recv_timestamped(arrival_ns)
+                    else:
+                        self._heartbeat_socket.recv_into(self._rx_buffer)
+                except socket.error:
+                    break
+                received = True
+
+        if received:
+            now_ns = time.monotonic_ns()
+            if arrival_ns is not None:
+                # The kernel stamp is wall-clock time; shift it by the current offset
+                now_ns = min(now_ns, arrival_ns - (time.time_ns() - now_ns))
+            self._last_heartbeat = now_ns
+            logger.debug("Heartbeat received.")
+
+    def _recv_timestamped(self, arrival_ns: Optional[int]) -> Optional[int]:
+        """Read one heartbeat along with its kernel arrival timestamp.
 
-    def check_timeout(self) -> bool:
+        Args:
+            arrival_ns (int, optional): Arrival time of the previous datagram,
+                kept if this one carries no timestamp.
+
+        Returns:
+            Optional[int]: Wall-clock arrival time in nanoseconds, if known.
+        """
+        _, ancdata, _, _ = self._heartbeat_socket.recvmsg_into(
+            [self._rx_buffer], self._ancbufsize
+        )
+        for level, kind, data in ancdata:
+            if level == socket.SOL_SOCKET and kind == _SO_TIMESTAMPNS:
+                sec, nsec = _TIMESPEC.unpack_from(data)
+                arrival_ns = sec * 1_000_000_000 + nsec
+        return arrival_ns
+
+    def check_timeout(self, now_ns: Optional[int] = None) -> bool:
         """Check if the heartbeat timeout threshold has been exceeded.
 
         Calculates the time elapsed since the last heartbeat and compares it
         against the configured timeout threshold to determine if the detector
-        process should be considered unresponsive.
+        process should be considered unresponsive. The heartbeat timestamp is
+        seeded at construction, so a fresh monitor is never considered timed out.
+
+        Args:
+            now_ns (int, optional): Current monotonic time in nanoseconds. Read
+                from the clock when omitted.
 
         Returns:
             bool: True if the timeout threshold has been exceeded, False otherwise.
         """
-        if self._last_heartbeat:
-            delta = datetime.now() - self._last_heartbeat
-            return (delta.total_seconds() * 1000) > self._timeout_threshold
-        return False
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        return now_ns - self._last_heartbeat > self._timeout_ns
+
+    def time_until_timeout(self, now_ns: Optional[int] = None) -> float:
+        """Compute how long the monitor may wait before the timeout expires.
+
+        Used as the selector timeout so the monitoring loop wakes up exactly when
+        the heartbeat timeout threshold would be exceeded.
+
+        Args:
+            now_ns (int, optional): Current monotonic time in nanoseconds. Read
+                from the clock when omitted.
+
+        Returns:
+            float: Seconds remaining until timeout, never negative.
+        """
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        elapsed_ns = now_ns - self._last_heartbeat
+        return max(0.0, (self._timeout_ns - elapsed_ns) / 1e9)
 
     def restart_process(self) -> None:
         """Coordinate detector process restart with the ProcessManager.
 
         Requests the ProcessManager to restart the detector process and resets
         the heartbeat timestamp to begin fresh monitoring. This method is called
-        when a heartbeat timeout is detected.
+        when a heartbeat timeout or a worker exit is detected. The heartbeat socket
+        is kept open across restarts, so heartbeats the new worker sends early are
+        already queued on it.
+
+        Raises:
+            RuntimeError: If the monitor has already been closed.
         """
+        if self._heartbeat_socket.fileno() == -1:
+            raise RuntimeError("Heartbeat socket is closed. Cannot restart process.")
         if self._process_manager:
-            self._process_manager.restart_process()
-            self._last_heartbeat = datetime.now()
+            self._watch_worker(self._process_manager.restart_process())
+            self._last_heartbeat = time.monotonic_ns()
             logger.info("Process restarted and heartbeat tracking reset.")
         else:
             logger.error("Error: ProcessManager not available for restart.")
 
+    def close(self) -> None:
+        """Release the heartbeat socket, selector, and worker pidfd.
+
+        The socket lives as long as the monitor, not the worker, so this is only
+        called once at final teardown. A Unix socket path is removed as well.
+        """
+        self._watch_worker(None)
+        self._selector.close()
+        self._heartbeat_socket.close()
+        if HEARTBEAT_SOCKET_PATH and hasattr(socket, "AF_UNIX"):
+            try:
+                os.unlink(HEARTBEAT_SOCKET_PATH)
+            except FileNotFoundError:
+                pass
+
+    @contextlib.contextmanager
+    def _signal_wakeup(self) -> Iterator[Optional[socket.socket]]:
+        """Route shutdown signals through the selector while the block runs.
+
+        SIGINT and SIGTERM get a handler that does nothing, and the interpreter
+        writes each signal to a socket pair registered with the selector. A
+        signal therefore wakes the monitoring loop immediately, even during a
+        restart, instead of raising in whatever code happens to be running.
+        Signal handlers can only be changed from the main thread; elsewhere the
+        existing handling is left alone.
+
+        Yields:
+            socket.socket: Socket that becomes readable on a signal, or None when
+                signals are left alone.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            yield None
+            return
+
+        reader, writer = socket.socketpair()
+        previous_fd = None
+        previous_handlers = {}
+        registered = False
+        try:
+            reader.setblocking(False)
+            writer.setblocking(False)
+            previous_fd = signal.set_wakeup_fd(writer.fileno())
+            for signum in _SHUTDOWN_SIGNALS:
+                previous_handlers[signum] = signal.signal(signum, _wake_on_signal)
+            self._selector.register(reader, selectors.EVENT_READ)
+            registered = True
+            yield reader
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            if previous_fd is not None:
+                signal.set_wakeup_fd(previous_fd)
+            if registered:
+                self._selector.unregister(reader)
+            reader.close()
+            writer.close()
+
+    def _watch_worker(self, proc: Optional["subprocess.Popen[Any]"]) -> None:
+        """Register a pidfd for the worker so its exit wakes the selector.
+
+        The previously watched worker, if any, is released first. Without pidfd
+        support the heartbeat timeout remains the only failure signal.
+
+        Args:
+            proc (subprocess.Popen, optional): Worker to watch, or None to stop
+                watching.
+        """
+        if self._worker_pidfd is not None:
+            self._selector.unregister(self._worker_pidfd)
+            os.close(self._worker_pidfd)
+            self._worker_pidfd = None
+        if proc is None or _pidfd_open is None:
+            return
+        try:
+            pidfd: int = _pidfd_open(proc.pid)
+        except OSError:
+            # The worker is already gone or the kernel predates pidfd_open
+            return
+        self._worker_pidfd = pidfd
+        self._selector.register(pidfd, selectors.EVENT_READ)
+
 
 def main() -> None:  # pragma: no cover
     """Main entry point for standalone monitor usage.
@@ -153,7 +519,8 @@ def main() -> None:  # pragma: no cover
     manager = ProcessManager(duration=10)
     monitor._process_manager = manager
 
-    detector_cmd = ["python", "src/detector.py"]
+    # Same worker command as process_manager.main()
+    detector_cmd = [sys.executable, "-S", "src/detector.py"]
     monitor.start_monitoring(detector_cmd)
 
 
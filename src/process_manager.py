@@ -5,15 +5,119 @@ heartbeat monitoring system, managing the HeartbeatMonitor service and
 ObstacleDetector worker process for fault-tolerant obstacle detection.
 """
 
-import subprocess
-from typing import Any, List, Optional
+from __future__ import annotations
 
-from config import DEFAULT_DURATION
+import gc
+import os
+import select
+import shutil
+import subprocess
+import time
+from collections import deque
+from typing import Any, Deque, List, Optional, Sequence, Tuple
+
+from config import (
+    DEFAULT_DURATION,
+    STANDBY_ENV_VAR,
+    TERMINATE_TIMEOUT,
+    WARM_STANDBY,
+)
 from logger import get_logger
 from monitor import HeartbeatMonitor
 
 logger = get_logger(__name__)
 
+# Process descriptors (Linux 5.3+, Python 3.9+) become readable when the process exits.
+_pidfd_open = getattr(os, "pidfd_open", None)
+
+
+def _wait_for_exit(proc: subprocess.Popen[Any], timeout: float) -> None:
+    """Wait for a process to exit and reap it.
+
+    Where pidfds are available the wait blocks in poll() on the process
+    descriptor, so the exit is seen as soon as it happens. Popen.wait() with a
+    timeout instead sleeps between non-blocking waitpid() checks.
+
+    Args:
+        proc: Process to wait for.
+        timeout: Maximum time to wait in seconds.
+
+    Raises:
+        subprocess.TimeoutExpired: If the process is still running after timeout.
+    """
+    if _pidfd_open is not None:
+        try:
+            pidfd = _pidfd_open(proc.pid)
+        except OSError:
+            # Already reaped, or the kernel predates pidfd_open
+            pass
+        else:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                ready = poller.poll(timeout * 1000)
+            finally:
+                os.close(pidfd)
+            if not ready:
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+    proc.wait(timeout=timeout)
+
+
+def _wait_many(
+    procs: Sequence[subprocess.Popen[Any]], timeout: float
+) -> List[subprocess.Popen[Any]]:
+    """Wait for several processes to exit in parallel and reap them.
+
+    The pidfds of all processes are registered with a single poll() object, so
+    waiting for N exits costs one shared timeout rather than N sequential ones.
+    Processes whose pidfd cannot be opened, including when the descriptor limit
+    is reached, are waited on with Popen.wait() against the same deadline.
+
+    Args:
+        procs: Processes to wait for.
+        timeout: Maximum time to wait for all of them in seconds.
+
+    Returns:
+        The processes still running when the timeout expired.
+    """
+    deadline = time.monotonic() + timeout
+    pending = {}
+    fallback: List[subprocess.Popen[Any]] = []
+    if _pidfd_open is None:
+        fallback.extend(procs)
+    else:
+        for proc in procs:
+            try:
+                pending[_pidfd_open(proc.pid)] = proc
+            except OSError:
+                fallback.append(proc)
+
+    try:
+        # Only pidfds need poll(); select.poll does not exist on Windows
+        if pending:
+            poller = select.poll()
+            for pidfd in pending:
+                poller.register(pidfd, select.POLLIN)
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for pidfd, _ in poller.poll(remaining * 1000):
+                poller.unregister(pidfd)
+                os.close(pidfd)
+                pending.pop(pidfd).wait()
+    finally:
+        for pidfd in pending:
+            os.close(pidfd)
+
+    running = list(pending.values())
+    for proc in fallback:
+        try:
+            proc.wait(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            running.append(proc)
+    return running
+
 
 class ProcessManager:
     """Orchestrate the heartbeat-based obstacle detection system.
@@ -23,15 +127,35 @@ class ProcessManager:
     fault-tolerant system lifecycle.
 
     Attributes:
-        _worker_cmd: Command used to start the worker process.
+        _worker_cmd: Command used to start the worker process, stored as a tuple
+            so it cannot change between restarts. The executable is resolved
+            against PATH once, so respawns skip the execvp() PATH search.
+        _worker_cmd_str: Worker command joined once for log messages.
         _worker_process: Reference to the current worker process.
+        _standbys: Pool of pre-started workers blocked on their stdin pipes until
+            promoted, kept WARM_STANDBY deep.
         _monitor: The heartbeat monitoring service instance.
+        _devnull: Descriptor for the null device, opened once and shared by
+            every worker spawn for stdout and stderr. None after shutdown.
         _duration: Total system runtime duration in seconds.
     """
 
-    _worker_cmd: Optional[List[str]]
+    __slots__ = (
+        "_worker_cmd",
+        "_worker_cmd_str",
+        "_worker_process",
+        "_standbys",
+        "_monitor",
+        "_devnull",
+        "_duration",
+    )
+
+    _worker_cmd: Optional[Tuple[str, ...]]
+    _worker_cmd_str: str
     _worker_process: Optional[subprocess.Popen[Any]]
+    _standbys: Deque[subprocess.Popen[Any]]
     _monitor: Optional[HeartbeatMonitor]
+    _devnull: Optional[int]
     _duration: int
 
     def __init__(self, duration: Optional[int] = None) -> None:
@@ -41,30 +165,43 @@ class ProcessManager:
             duration: Total system runtime duration in seconds.
         """
         self._worker_cmd = None
+        self._worker_cmd_str = ""
         self._worker_process = None
+        self._standbys = deque()
         self._monitor = None
+        self._devnull = os.open(os.devnull, os.O_RDWR)
         self._duration = duration or DEFAULT_DURATION
 
     def start_process(self, cmd: List[str]) -> subprocess.Popen[Any]:
         """Launch a new worker process.
 
+        With WARM_STANDBY enabled, the standby pool is filled alongside it.
+        A relative executable is resolved against PATH here, once, and the
+        absolute path is reused for every later spawn.
+
         Args:
             cmd: Command and arguments to start the worker process.
 
         Returns:
             Reference to the started worker process.
         """
-        logger.info(f"Starting worker process with command: {' '.join(cmd)}")
-        self._worker_cmd = cmd
-        proc = subprocess.Popen(
-            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-        )
-        self._worker_process = proc
+        executable = cmd[0]
+        if not os.path.isabs(executable):
+            executable = shutil.which(executable) or executable
+        self._worker_cmd = (executable, *cmd[1:])
+        self._worker_cmd_str = " ".join(cmd)
+        logger.info("Starting worker process with command: %s", self._worker_cmd_str)
+        proc = self._spawn(self._worker_cmd)
+        self._fill_standbys(self._worker_cmd)
         return proc
 
     def restart_process(self) -> subprocess.Popen[Any]:
         """Restart the worker process with the stored command.
 
+        A live standby worker is promoted instead of spawning a new process, which
+        skips interpreter startup before the first heartbeat. The standby pool is
+        refilled right away.
+
         Returns:
             Reference to the new worker process.
 
@@ -74,39 +211,135 @@ class ProcessManager:
         if not self._worker_cmd:
             raise ValueError("No command stored. Call start_process() first.")
 
-        if self._worker_process and self.is_process_running():
+        # One poll() decides; _terminate_running() does not check again
+        old = self._worker_process
+        if old is not None and old.poll() is None:
             logger.info("Terminating existing worker process...")
-            self.terminate_process(self._worker_process)
+            self._terminate_running(old)
 
-        logger.info(
-            f"Restarting worker process with command: {' '.join(self._worker_cmd)}"
-        )
+        logger.info("Restarting worker process with command: %s", self._worker_cmd_str)
+        proc = self._promote_standby() or self._spawn(self._worker_cmd)
+        self._fill_standbys(self._worker_cmd)
+        return proc
+
+    def _spawn(self, cmd: Sequence[str]) -> subprocess.Popen[Any]:
+        """Spawn the worker with its output discarded.
+
+        The worker runs in its own session, so a terminal Ctrl+C reaches only
+        the manager, which then shuts the worker down itself.
+
+        Args:
+            cmd: Command and arguments to start the worker process.
+
+        Returns:
+            Reference to the new worker process.
+        """
+        devnull = subprocess.DEVNULL if self._devnull is None else self._devnull
         proc = subprocess.Popen(
-            self._worker_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            cmd, stdout=devnull, stderr=devnull, start_new_session=True
         )
         self._worker_process = proc
         return proc
 
+    def _fill_standbys(self, cmd: Sequence[str]) -> None:
+        """Start standby workers until the pool holds WARM_STANDBY of them.
+
+        Each standby waits on its stdin pipe for promotion and, like the
+        worker, runs in its own session.
+
+        Args:
+            cmd: Command and arguments to start the worker process.
+        """
+        if len(self._standbys) >= WARM_STANDBY:
+            # Skip copying the environment when the pool is full or disabled
+            return
+        devnull = subprocess.DEVNULL if self._devnull is None else self._devnull
+        env = {**os.environ, STANDBY_ENV_VAR: "1"}
+        while len(self._standbys) < WARM_STANDBY:
+            self._standbys.append(
+                subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=devnull,
+                    stderr=devnull,
+                    env=env,
+                    start_new_session=True,
+                )
+            )
+
+    def _promote_standby(self) -> Optional[subprocess.Popen[Any]]:
+        """Wake the oldest live standby worker and make it the current worker.
+
+        Standbys that have already exited are reaped and skipped.
+
+        Returns:
+            The promoted worker, or None if there is no live standby.
+        """
+        while self._standbys:
+            standby = self._standbys.popleft()
+            if standby.stdin is None:
+                continue
+            try:
+                standby.stdin.write(b"1")
+                standby.stdin.close()
+            except OSError:
+                # The standby already exited and closed its end of the pipe
+                standby.wait()
+                continue
+            logger.info("Promoted standby worker process.")
+            self._worker_process = standby
+            return standby
+        return None
+
     def terminate_process(self, proc: subprocess.Popen[Any]) -> None:
         """Gracefully terminate a process with proper cleanup.
 
         Attempts graceful termination first, then forces termination if the process
-        doesn't exit within the timeout period. Uses safe process termination to
+        doesn't exit within TERMINATE_TIMEOUT. Uses safe process termination to
         avoid PID reuse attacks and race conditions.
 
         Args:
             proc: Process to terminate.
         """
         if proc.poll() is None:
+            self._terminate_running(proc)
+
+    def _terminate_running(self, proc: subprocess.Popen[Any]) -> None:
+        """Terminate a process the caller has just seen running.
+
+        Args:
+            proc: Live process to terminate.
+        """
+        proc.terminate()
+        try:
+            _wait_for_exit(proc, TERMINATE_TIMEOUT / 1000)
+        except subprocess.TimeoutExpired:
+            try:
+                proc.kill()
+                _wait_for_exit(proc, 2)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+
+    def terminate_processes(self, procs: Sequence[subprocess.Popen[Any]]) -> None:
+        """Terminate several processes, waiting for their exits together.
+
+        Every live process is signalled first and then all of them are waited on
+        at once, so the grace period is shared instead of paid per process.
+        Processes that outlive it are killed.
+
+        Args:
+            procs: Processes to terminate.
+        """
+        live = [proc for proc in procs if proc.poll() is None]
+        for proc in live:
             proc.terminate()
+        stuck = _wait_many(live, TERMINATE_TIMEOUT / 1000)
+        for proc in stuck:
             try:
-                proc.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                try:
-                    proc.kill()
-                    proc.wait(timeout=2)
-                except (OSError, subprocess.TimeoutExpired):
-                    pass
+                proc.kill()
+            except OSError:
+                pass
+        _wait_many(stuck, 2)
 
     def is_process_running(self) -> bool:
         """Check if the worker process is currently running.
@@ -128,10 +361,16 @@ class ProcessManager:
             detector_cmd: Command and arguments for the detector process.
         """
         logger.info("Starting heartbeat monitoring system...")
-        logger.info(f"System duration: {self._duration} seconds")
+        logger.info("System duration: %d seconds", self._duration)
 
         self._monitor = HeartbeatMonitor(duration=self._duration)
         self._monitor._process_manager = self
+
+        # Move everything allocated during startup out of the collector's reach,
+        # so later collections in the monitor loop only scan new objects.
+        # Objects created after this point are tracked as usual.
+        gc.collect()
+        gc.freeze()
         self._monitor.start_monitoring(detector_cmd)
 
         logger.info("System shutdown completed.")
@@ -140,17 +379,34 @@ class ProcessManager:
         """Gracefully shutdown the entire monitoring system.
 
         Terminates all running processes and cleans up resources in the
-        correct order to ensure proper system shutdown.
+        correct order to ensure proper system shutdown. The monitor socket and
+        the null device are released even if terminating a process fails.
         """
         logger.info("Shutting down system...")
 
-        if self._worker_process and self.is_process_running():
-            logger.info("Terminating detector process...")
-            self.terminate_process(self._worker_process)
-
-        if self._monitor and hasattr(self._monitor, "_heartbeat_socket"):
-            logger.info("Closing monitor socket...")
-            self._monitor._heartbeat_socket.close()
+        try:
+            procs = []
+            if self._worker_process and self.is_process_running():
+                logger.info("Terminating detector process...")
+                procs.append(self._worker_process)
+
+            while self._standbys:
+                standby = self._standbys.popleft()
+                # A standby exits on its own once its stdin pipe is closed
+                if standby.stdin is not None:
+                    standby.stdin.close()
+                procs.append(standby)
+
+            if procs:
+                self.terminate_processes(procs)
+        finally:
+            if self._monitor is not None:
+                logger.info("Closing monitor socket...")
+                self._monitor.close()
+
+            if self._devnull is not None:
+                os.close(self._devnull)
+                self._devnull = None
 
         logger.info("System shutdown completed.")
 
@@ -160,16 +416,19 @@ def main() -> None:  # pragma: no cover
     import sys
 
     duration = 60
-    detector_cmd = ["python", "src/detector.py"]
+    # The detector only needs the standard library, so skip site initialization
+    detector_cmd = [sys.executable, "-S", "src/detector.py"]
 
     # Parse command line arguments for duration
     if len(sys.argv) > 1:
         try:
             duration = int(sys.argv[1])
-            logger.info(f"Using custom duration: {duration} seconds")
+            logger.info("Using custom duration: %d seconds", duration)
         except ValueError:
             logger.warning(
-                f"Invalid duration '{sys.argv[1]}', using default: {duration} seconds"
+                "Invalid duration '%s', using default: %d seconds",
+                sys.argv[1],
+                duration,
             )
 
     manager = ProcessManager(duration=duration)
@@ -177,10 +436,12 @@ def main() -> None:  # pragma: no cover
     try:
         manager.start_system(detector_cmd)
     except KeyboardInterrupt:
+        # Monitoring turns Ctrl+C into a clean shutdown itself; this catches one
+        # during startup or a second one while shutdown is still terminating.
         logger.info("\nReceived interrupt signal...")
         manager.shutdown_system()
     except Exception as e:
-        logger.error(f"System error: {e}")
+        logger.error("System error: %s", e)
         manager.shutdown_system()
         sys.exit(1)
 
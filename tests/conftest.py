@@ -0,0 +1,32 @@
+"""Shared pytest fixtures for the test suite."""
+
+import socket
+
+import pytest
+
+
+@pytest.fixture
+def deny_network(monkeypatch):
+    """Fail any test that binds or connects a real network socket.
+
+    Unix-domain sockets (such as the monitor's signal wakeup socketpair) stay
+    usable; only IPv4/IPv6 addresses are refused.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+
+    def guard(method_name):
+        original = getattr(socket.socket, method_name)
+
+        def guarded(sock, *args, **kwargs):
+            if sock.family in (socket.AF_INET, socket.AF_INET6):
+                raise RuntimeError(
+                    f"Network access attempted via socket.{method_name}{args!r}"
+                )
+            return original(sock, *args, **kwargs)
+
+        monkeypatch.setattr(socket.socket, method_name, guarded)
+
+    for method_name in ("bind", "connect", "connect_ex", "sendto"):
+        guard(method_name)
@@ -0,0 +1,79 @@
+"""Test suite for batched heartbeat reception.
+
+This module exercises the ``recvmmsg`` wrapper against real loopback UDP sockets,
+so it only runs on platforms where batched reception is supported.
+"""
+
+import socket
+
+import pytest
+
+from src import batch_io
+
+pytestmark = pytest.mark.skipif(
+    not batch_io.is_supported(), reason="recvmmsg is only available on Linux"
+)
+
+
+@pytest.fixture
+def udp_pair():
+    """Create a connected pair of non-blocking loopback UDP sockets.
+
+    Yields:
+        tuple: The (receiver, sender) sockets.
+    """
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        receiver.bind(("127.0.0.1", 0))
+        receiver.setblocking(False)
+        sender.connect(receiver.getsockname())
+        yield receiver, sender
+    finally:
+        receiver.close()
+        sender.close()
+
+
+def test_drain_empty_socket(udp_pair):
+    """Test that draining an empty socket reports no datagrams.
+
+    Args:
+        udp_pair: Loopback receiver and sender sockets.
+    """
+    receiver, _ = udp_pair
+
+    assert batch_io.BatchReceiver(receiver, 4).drain() == 0
+
+
+@pytest.mark.parametrize("sent", [1, 4, 9])
+def test_drain_reads_all_queued_datagrams(udp_pair, sent):
+    """Test that every queued datagram is consumed across batches.
+
+    Args:
+        udp_pair: Loopback receiver and sender sockets.
+        sent: Number of datagrams queued before draining.
+    """
+    receiver, sender = udp_pair
+    for _ in range(sent):
+        sender.send(b"12345678")
+
+    batch_receiver = batch_io.BatchReceiver(receiver, 4)
+
+    assert batch_receiver.drain() == sent
+    assert batch_receiver.drain() == 0
+
+
+def test_drain_reads_full_batch_in_one_call(udp_pair, mocker):
+    """Test that a batch worth of queued datagrams costs one recvmmsg call.
+
+    Args:
+        udp_pair: Loopback receiver and sender sockets.
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    receiver, sender = udp_pair
+    for _ in range(7):
+        sender.send(b"12345678")
+    recvmmsg = mocker.patch.object(batch_io, "_recvmmsg", wraps=batch_io._recvmmsg)
+
+    assert batch_io.BatchReceiver(receiver, 8).drain() == 7
+    recvmmsg.assert_called_once()
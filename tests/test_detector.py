@@ -5,22 +5,38 @@ including heartbeat functionality, detection loop behavior, failure simulation,
 and configuration validation.
 """
 
+import io
 import socket
-from datetime import datetime
+import struct
+from unittest.mock import Mock, patch
 
 import pytest
 
-from src.detector import ObstacleDetector
+from src.detector import ObstacleDetector, wait_for_promotion
 
+pytestmark = pytest.mark.usefixtures("deny_network")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def detector():
-    """Create an ObstacleDetector instance for testing.
+    """Create one ObstacleDetector instance shared by the tests in this module.
 
     Returns:
-        ObstacleDetector: Configured detector instance with default settings.
+        ObstacleDetector: Configured detector instance with default settings and
+            a mocked socket.
     """
-    return ObstacleDetector()
+    with patch("src.detector.socket.socket", return_value=Mock(spec=socket.socket)):
+        return ObstacleDetector()
+
+
+@pytest.fixture(autouse=True)
+def reset_detector(detector):
+    """Return the shared detector to its initial stopped state before each test.
+
+    Args:
+        detector: Shared ObstacleDetector fixture.
+    """
+    detector._running = False
 
 
 @pytest.fixture
@@ -33,37 +49,123 @@ def mocked_detector(mocker):
     Returns:
         ObstacleDetector: Configured detector instance with mocked socket.
     """
-    detector = ObstacleDetector()
-    detector._heartbeat_socket = mocker.Mock(spec=socket.socket)
-    return detector
+    mocker.patch(
+        "src.detector.socket.socket", return_value=mocker.Mock(spec=socket.socket)
+    )
+    return ObstacleDetector()
+
+
+@pytest.fixture
+def mock_sleep(mocker):
+    """Replace the detector's sleep with a mock so loop tests never block.
+
+    Args:
+        mocker: Pytest mocker fixture for patching dependencies.
+
+    Returns:
+        Mock: The patched time.sleep.
+    """
+    return mocker.patch("src.detector.time.sleep")
 
 
 def test_send_heartbeat(mocked_detector, mocker):
     """Verify heartbeat message formatting and transmission.
 
     Tests that heartbeat messages are properly formatted with timestamps
-    and sent to the correct monitor address via UDP socket.
+    and sent on the socket connected to the monitor address.
+
+    Args:
+        mocked_detector: ObstacleDetector fixture with mocked socket.
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    mock_now = 1_000_000_000_000
+    mocker.patch("src.detector.time.monotonic_ns", return_value=mock_now)
+
+    mock_logger = mocker.patch("src.detector.logger")
+
+    mocked_detector.send_heartbeat()
+
+    expected_message = struct.pack("<Q", mock_now)
+    mocked_detector._heartbeat_socket.send.assert_called_once_with(expected_message)
+    mock_logger.debug.assert_called_once_with("Heartbeat sent at %d", mock_now)
+
+
+def test_send_heartbeat_reuses_packet_buffer(mocked_detector, mocker):
+    """Verify every heartbeat is packed into the same preallocated buffer.
+
+    Args:
+        mocked_detector: ObstacleDetector fixture with mocked socket.
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    mocker.patch("src.detector.time.monotonic_ns", side_effect=[1, 2])
+    mocker.patch("src.detector.logger")
+    send = mocked_detector._heartbeat_socket.send
+
+    mocked_detector.send_heartbeat()
+    mocked_detector.send_heartbeat()
+
+    first, second = (args[0] for args, _ in send.call_args_list)
+    assert first is second is mocked_detector._packet
+    assert bytes(mocked_detector._packet) == struct.pack("<Q", 2)
+
+
+def test_send_heartbeat_refused(mocked_detector, mocker):
+    """Verify a refused heartbeat is dropped instead of raising.
 
     Args:
         mocked_detector: ObstacleDetector fixture with mocked socket.
         mocker: Pytest mocker fixture for patching dependencies.
     """
-    mock_datetime = mocker.patch("src.detector.datetime")
-    mock_now = datetime(2025, 7, 5, 12, 0, 0)
-    mock_datetime.now.return_value = mock_now
+    mocker.patch("src.detector.time.monotonic_ns", return_value=7)
+    mock_logger = mocker.patch("src.detector.logger")
+    mocked_detector._heartbeat_socket.send.side_effect = ConnectionRefusedError
+
+    mocked_detector.send_heartbeat()
+
+    mock_logger.debug.assert_called_once_with(
+        "Heartbeat at %d refused: monitor not listening", 7
+    )
+
+
+def test_send_heartbeat_reconnects_after_refusal(mocked_detector, mocker):
+    """Verify a refused heartbeat makes the next send connect again.
+
+    Args:
+        mocked_detector: ObstacleDetector fixture with mocked socket.
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    mocker.patch("src.detector.logger")
+    sock = mocked_detector._heartbeat_socket
+    sock.send.side_effect = [ConnectionRefusedError, 8]
+
+    mocked_detector.send_heartbeat()
+    mocked_detector.send_heartbeat()
+
+    assert sock.connect.call_count == 2
+    assert sock.send.call_count == 2
+    assert mocked_detector._connected is True
+
 
+def test_send_heartbeat_queue_full(mocked_detector, mocker):
+    """Verify a heartbeat that would block is dropped instead of waiting.
+
+    Args:
+        mocked_detector: ObstacleDetector fixture with mocked socket.
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    mocker.patch("src.detector.time.monotonic_ns", return_value=7)
     mock_logger = mocker.patch("src.detector.logger")
+    mocked_detector._heartbeat_socket.send.side_effect = BlockingIOError
 
     mocked_detector.send_heartbeat()
 
-    expected_message = mock_now.strftime("%Y-%m-%d %H:%M:%S.%f").encode("utf-8")
-    mocked_detector._heartbeat_socket.sendto.assert_called_once_with(
-        expected_message, ("localhost", 9999)
+    mock_logger.debug.assert_called_once_with(
+        "Heartbeat at %d dropped: monitor queue full", 7
     )
-    mock_logger.info.assert_called_once_with(f"Heartbeat sent at {mock_now}")
+    assert mocked_detector._connected is True
 
 
-def test_run_detection_loop(mocked_detector, mocker):
+def test_run_detection_loop(mocked_detector, mocker, mock_sleep):
     """Validate detection loop execution for specified iterations.
 
     Tests that the detection loop runs for the exact number of specified
@@ -72,23 +174,68 @@ def test_run_detection_loop(mocked_detector, mocker):
     Args:
         mocked_detector: ObstacleDetector fixture with mocked socket.
         mocker: Pytest mocker fixture for patching dependencies.
+        mock_sleep: Patched time.sleep fixture.
     """
-    mock_sleep = mocker.patch("src.detector.time.sleep")
-    mocker.patch("src.detector.random.uniform", return_value=42.0)
-    mocker.patch(
-        "src.detector.random.random", return_value=0.5
+    mocker.patch.object(mocked_detector._rng, "uniform", return_value=42.0)
+    mocker.patch.object(
+        mocked_detector._rng, "random", return_value=0.5
     )  # Prevent failure simulation
 
     mocked_detector.run_detection_loop(max_iterations=3)
 
     assert (
-        mocked_detector._heartbeat_socket.sendto.call_count == 3
+        mocked_detector._heartbeat_socket.send.call_count == 3
     ), "Should send 3 heartbeats"
     # Verify sleep was called for main loop intervals
     assert mock_sleep.call_count >= 3, "Should sleep at least 3 times for main loop"
 
 
-def test_detect_obstacles(detector, mocker):
+def test_run_detection_loop_zero_iterations(mocked_detector, mock_sleep):
+    """Verify a zero iteration budget exits before doing any work.
+
+    Args:
+        mocked_detector: ObstacleDetector fixture with mocked socket.
+        mock_sleep: Patched time.sleep fixture.
+    """
+    mocked_detector.run_detection_loop(max_iterations=0)
+
+    mocked_detector._heartbeat_socket.send.assert_not_called()
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "clock,expected_sleep",
+    [
+        ([0.0, 0.01], 0.04),  # 10ms of work leaves 40ms of the 50ms tick
+        ([0.0, 0.2, 0.2], None),  # Overran the tick - no sleep, re-anchor
+    ],
+)
+def test_run_detection_loop_absolute_schedule(
+    mocked_detector, mocker, mock_sleep, clock, expected_sleep
+):
+    """Verify the loop sleeps only for the remainder of each heartbeat tick.
+
+    Args:
+        mocked_detector: ObstacleDetector fixture with mocked socket.
+        mocker: Pytest mocker fixture for patching dependencies.
+        mock_sleep: Patched time.sleep fixture.
+        clock: Successive readings returned by the monotonic clock.
+        expected_sleep: Expected sleep duration in seconds, or None if the
+            loop should not sleep at all.
+    """
+    mocker.patch("src.detector.time.monotonic", side_effect=clock)
+    mocker.patch.object(mocked_detector, "detect_obstacles")
+    mocker.patch.object(mocked_detector, "simulate_failure")
+
+    mocked_detector.run_detection_loop(max_iterations=1)
+
+    if expected_sleep is None:
+        mock_sleep.assert_not_called()
+    else:
+        mock_sleep.assert_called_once_with(pytest.approx(expected_sleep))
+
+
+def test_detect_obstacles(detector, mocker, mock_sleep):
     """Test obstacle detection simulation with timing and distance calculation.
 
     Verifies that obstacle detection includes proper timing delays and
@@ -97,9 +244,9 @@ def test_detect_obstacles(detector, mocker):
     Args:
         detector: ObstacleDetector fixture.
         mocker: Pytest mocker fixture for patching dependencies.
+        mock_sleep: Patched time.sleep fixture.
     """
-    mock_sleep = mocker.patch("src.detector.time.sleep")
-    mock_random = mocker.patch("src.detector.random.uniform", return_value=42.0)
+    mock_random = mocker.patch.object(detector._rng, "uniform", return_value=42.0)
 
     mock_logger = mocker.patch("src.detector.logger")
 
@@ -107,41 +254,47 @@ def test_detect_obstacles(detector, mocker):
 
     mock_sleep.assert_called_once()
     assert mock_random.call_count == 2  # Sleep duration and distance calculation
-    mock_logger.info.assert_called_once_with("Detected obstacle at 42.00 meters.")
+    mock_logger.info.assert_called_once_with("Detected obstacle at %.2f meters.", 42.0)
 
 
-@pytest.mark.parametrize(
-    "random_value,should_exit",
-    [
-        (0.5, False),  # Above threshold, no exit
-        (0.02, False),  # Just above threshold, no exit
-        (0.009, True),  # Below threshold, should exit
-        (0.005, True),  # Well below threshold, should exit
-    ],
-)
-def test_simulate_failure(detector, mocker, random_value, should_exit):
+def test_simulate_failure(detector, mocker):
     """Test failure simulation with various probability values.
 
     Verifies that the failure simulation correctly triggers or avoids
-    process termination based on random probability thresholds.
+    process termination based on random probability thresholds. All
+    threshold cases share one detector and one set of patches, resetting the
+    mocks between cases.
 
     Args:
         detector: ObstacleDetector fixture.
         mocker: Pytest mocker fixture for patching dependencies.
-        random_value: Mocked random value to test.
-        should_exit: Whether the test should expect a SystemExit.
     """
-    mock_random = mocker.patch("src.detector.random.random", return_value=random_value)
+    cases = [
+        (0.5, False),  # Above threshold, no exit
+        (0.02, False),  # Just above threshold, no exit
+        (0.01, False),  # Exactly at threshold, no exit
+        (0.009, True),  # Below threshold, should exit
+        (0.005, True),  # Well below threshold, should exit
+    ]
+    mock_random = mocker.patch.object(detector._rng, "random")
+    mock_stop_logging = mocker.patch("src.detector.stop_logging")
+    mock_exit = mocker.patch("src.detector.os._exit")
 
-    mock_exit = mocker.patch("builtins.exit")
+    for random_value, should_exit in cases:
+        mock_random.reset_mock()
+        mock_stop_logging.reset_mock()
+        mock_exit.reset_mock()
+        mock_random.return_value = random_value
 
-    detector.simulate_failure()
+        detector.simulate_failure()
 
-    mock_random.assert_called_once()
-    if should_exit:
-        mock_exit.assert_called_once_with(1)
-    else:
-        mock_exit.assert_not_called()
+        mock_random.assert_called_once()
+        if should_exit:
+            mock_stop_logging.assert_called_once_with()
+            mock_exit.assert_called_once_with(1)
+        else:
+            mock_stop_logging.assert_not_called()
+            mock_exit.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -170,37 +323,24 @@ def test_configuration_values(detector, attribute, expected_value, description):
     assert getattr(detector, attribute) == expected_value, description
 
 
-@pytest.fixture
-def real_socket():
-    """Create a real socket for testing and ensure cleanup.
-
-    Provides a real UDP socket for integration testing and automatically
-    handles cleanup to prevent resource leaks.
-
-    Yields:
-        socket.socket: A real UDP socket for testing.
-    """
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    try:
-        yield sock
-    finally:
-        sock.close()
-
-
-def test_heartbeat_socket_configuration(real_socket):
+def test_heartbeat_socket_configuration(mocker):
     """Confirm socket is configured for IPv4 UDP communication.
 
     Validates that the heartbeat socket is properly configured for
     IPv4 UDP communication as required by the heartbeat protocol.
 
     Args:
-        real_socket: Real socket fixture with automatic cleanup.
+        mocker: Pytest mocker fixture for patching dependencies.
     """
-    assert real_socket.family == socket.AF_INET, "Heartbeat socket should use IPv4"
-    assert real_socket.type == socket.SOCK_DGRAM, "Heartbeat socket should be UDP"
+    mocker.patch("src.detector.HEARTBEAT_SOCKET_PATH", None)
+    mock_socket_cls = mocker.patch("src.detector.socket.socket")
 
+    ObstacleDetector()
 
-def test_stop_detection_loop(mocked_detector, mocker):
+    mock_socket_cls.assert_called_once_with(socket.AF_INET, socket.SOCK_DGRAM)
+
+
+def test_stop_detection_loop(mocked_detector, mocker, mock_sleep):
     """Test graceful termination of the detection loop.
 
     Verifies that the detection loop can be stopped gracefully and
@@ -209,11 +349,11 @@ def test_stop_detection_loop(mocked_detector, mocker):
     Args:
         mocked_detector: ObstacleDetector fixture with mocked socket.
         mocker: Pytest mocker fixture for patching dependencies.
+        mock_sleep: Patched time.sleep fixture.
     """
-    mock_sleep = mocker.patch("src.detector.time.sleep")
-    mocker.patch("src.detector.random.uniform", return_value=42.0)
-    mocker.patch(
-        "src.detector.random.random", return_value=0.5
+    mocker.patch.object(mocked_detector._rng, "uniform", return_value=42.0)
+    mocker.patch.object(
+        mocked_detector._rng, "random", return_value=0.5
     )  # Prevent failure simulation
 
     def stop_after_first_sleep(*args, **kwargs):
@@ -225,39 +365,148 @@ def test_stop_detection_loop(mocked_detector, mocker):
 
     assert not mocked_detector._running, "Loop should be stopped"
     assert (
-        mocked_detector._heartbeat_socket.sendto.call_count == 1
+        mocked_detector._heartbeat_socket.send.call_count == 1
     ), "Should send one heartbeat before stopping"
 
 
-def test_detector_initialization():
+def test_detector_initialization(detector):
     """Test that detector initializes with correct default state.
 
     Verifies that a new detector instance is created with all expected
     default values and proper socket configuration.
-    """
-    detector = ObstacleDetector()
 
+    Args:
+        detector: ObstacleDetector fixture.
+    """
     assert detector._heartbeat_interval == 50
     assert detector._monitor_address == ("localhost", 9999)
     assert detector._running is False
     assert detector._heartbeat_socket is not None
 
-    # Clean up
-    detector._heartbeat_socket.close()
+
+def test_detector_sets_send_buffer(mocker):
+    """Test that the heartbeat socket send buffer is sized from configuration.
+
+    Args:
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    mock_socket = mocker.patch("src.detector.socket.socket").return_value
+
+    ObstacleDetector()
+
+    mock_socket.setsockopt.assert_called_once_with(
+        socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20
+    )
+
+
+def test_detector_connects_to_monitor(mocker):
+    """Test that the heartbeat socket is connected to the monitor address once.
+
+    Args:
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    mock_socket = mocker.patch("src.detector.socket.socket").return_value
+
+    ObstacleDetector()
+
+    mock_socket.connect.assert_called_once_with(("localhost", 9999))
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+def test_detector_connects_to_socket_path(mocker):
+    """Test that a configured socket path replaces the UDP monitor address.
+
+    Args:
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    mocker.patch("src.detector.HEARTBEAT_SOCKET_PATH", "/tmp/heartbeat.sock")
+    mock_socket_cls = mocker.patch("src.detector.socket.socket")
+
+    detector = ObstacleDetector()
+
+    mock_socket_cls.assert_called_once_with(socket.AF_UNIX, socket.SOCK_DGRAM)
+    mock_socket_cls.return_value.connect.assert_called_once_with("/tmp/heartbeat.sock")
+    assert detector._monitor_address == "/tmp/heartbeat.sock"
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+def test_detector_connects_once_socket_path_is_bound(tmp_path, mocker):
+    """Test that a detector started before the monitor connects on a later send.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    path = str(tmp_path / "heartbeat.sock")
+    mocker.patch("src.detector.HEARTBEAT_SOCKET_PATH", path)
+    mocker.patch("src.detector.logger")
+    detector = ObstacleDetector()
+    receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        assert detector._connected is False
+        detector.send_heartbeat()
+
+        receiver.bind(path)
+        detector.send_heartbeat()
+
+        assert detector._connected is True
+        assert len(receiver.recv(16)) == 8
+    finally:
+        receiver.close()
+        detector._heartbeat_socket.close()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+def test_detector_drops_heartbeats_when_monitor_stalls(tmp_path, mocker):
+    """Test that a full Unix datagram queue drops heartbeats instead of blocking.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    path = str(tmp_path / "heartbeat.sock")
+    mocker.patch("src.detector.HEARTBEAT_SOCKET_PATH", path)
+    mock_logger = mocker.patch("src.detector.logger")
+    receiver = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    receiver.bind(path)
+    detector = ObstacleDetector()
+    try:
+        # Never read: the receiver's queue fills after a handful of datagrams
+        for _ in range(1000):
+            detector.send_heartbeat()
+
+        mock_logger.debug.assert_any_call(
+            "Heartbeat at %d dropped: monitor queue full", mocker.ANY
+        )
+    finally:
+        receiver.close()
+        detector._heartbeat_socket.close()
 
 
-def test_stop_method():
+def test_stop_method(detector):
     """Test the stop method sets the running flag to False.
 
     Verifies that the stop method correctly updates the internal running
     state to allow graceful termination of the detection loop.
-    """
-    detector = ObstacleDetector()
 
+    Args:
+        detector: ObstacleDetector fixture.
+    """
     detector._running = True
     detector.stop()
 
     assert detector._running is False
 
-    # Clean up
-    detector._heartbeat_socket.close()
+
+@pytest.mark.parametrize("stdin_data,promoted", [(b"1", True), (b"", False)])
+def test_wait_for_promotion(mocker, stdin_data, promoted):
+    """Verify a standby is promoted by a byte and retired by a closed pipe.
+
+    Args:
+        mocker: Pytest mocker fixture for patching dependencies.
+        stdin_data: Bytes available on the standby's stdin pipe.
+        promoted: Whether the standby should report being promoted.
+    """
+    mocker.patch("src.detector.sys.stdin", io.TextIOWrapper(io.BytesIO(stdin_data)))
+
+    assert wait_for_promotion() is promoted
@@ -0,0 +1,100 @@
+"""Test suite for the logging configuration helpers.
+
+This module verifies the one-time, lazy setup performed by get_logger and the
+handlers attached by the background queue listener.
+"""
+
+import importlib
+import logging
+from logging.handlers import RotatingFileHandler
+
+import pytest
+
+from src import config
+from src import logger as app_logger
+
+
+@pytest.fixture
+def unconfigured(monkeypatch):
+    """Reset the module to its unconfigured state for the duration of a test.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(app_logger, "_configured", False)
+
+
+def test_get_logger_configures_once(unconfigured, mocker):
+    """Test that logging is configured on first use only.
+
+    Args:
+        unconfigured: Fixture resetting the configured flag.
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    mock_configure = mocker.patch.object(app_logger, "_configure")
+
+    first = app_logger.get_logger("first")
+    second = app_logger.get_logger("second")
+
+    mock_configure.assert_called_once_with()
+    assert first is logging.getLogger("first")
+    assert second is logging.getLogger("second")
+
+
+@pytest.mark.parametrize("log_file", ["", "logs/app.log"])
+def test_configure_file_handler(log_file, tmp_path, monkeypatch, mocker):
+    """Test that the rotating file handler is only created when a path is set.
+
+    Args:
+        log_file: Configured log file path relative to the working directory.
+        tmp_path: Pytest temporary directory fixture.
+        monkeypatch: Pytest monkeypatch fixture.
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(app_logger, "LOG_FILE", log_file)
+    mocker.patch.object(app_logger.logging, "basicConfig")
+    mocker.patch.object(app_logger.atexit, "register")
+    mock_listener = mocker.patch.object(app_logger, "QueueListener")
+
+    app_logger._configure()
+
+    handlers = mock_listener.call_args.args[1:]
+    file_handlers = [h for h in handlers if isinstance(h, RotatingFileHandler)]
+    assert len(file_handlers) == (1 if log_file else 0)
+    assert (tmp_path / "logs").is_dir() == bool(log_file)
+    for handler in file_handlers:
+        handler.close()
+    mock_listener.return_value.start.assert_called_once_with()
+    app_logger.stop_logging()
+    mock_listener.return_value.stop.assert_called_once_with()
+
+
+def test_log_file_disabled_by_default(monkeypatch):
+    """Test that file logging is opt-in, so importing the package writes nothing.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.delenv("LOG_FILE", raising=False)
+    try:
+        assert importlib.reload(config).LOG_FILE == ""
+    finally:
+        monkeypatch.undo()
+        importlib.reload(config)
+
+
+def test_stop_logging_is_idempotent(monkeypatch, mocker):
+    """Test that stopping logging twice stops the listener only once.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    mock_listener = mocker.Mock()
+    monkeypatch.setattr(app_logger, "_listener", mock_listener)
+
+    app_logger.stop_logging()
+    app_logger.stop_logging()
+
+    mock_listener.stop.assert_called_once_with()
@@ -5,14 +5,70 @@ including heartbeat reception, timeout detection, process management, and monito
 lifecycle operations.
 """
 
+import os
+import select
+import selectors
+import signal
 import socket
-from datetime import datetime, timedelta
+import struct
+import subprocess
+import sys
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 
+from src import monitor as monitor_module
 from src.monitor import HeartbeatMonitor
 
+pytestmark = pytest.mark.usefixtures("deny_network")
+
+# Arbitrary fixed reading of the monotonic clock used by time-sensitive tests.
+NOW_NS = 1_000_000_000_000
+
+
+class FakeClock:
+    """Monotonic nanosecond clock that only moves when a test advances it.
+
+    Attributes:
+        now_ns (int): Current reading in nanoseconds.
+    """
+
+    def __init__(self, now_ns: int = NOW_NS) -> None:
+        """Start the clock at a fixed reading.
+
+        Args:
+            now_ns (int): Initial reading in nanoseconds. Defaults to NOW_NS.
+        """
+        self.now_ns = now_ns
+
+    def __call__(self) -> int:
+        """Return the current reading, standing in for time.monotonic_ns."""
+        return self.now_ns
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward.
+
+        Args:
+            seconds (float): Time to advance by in seconds.
+        """
+        self.now_ns += int(seconds * 1_000_000_000)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Replace the monitor's monotonic clock with a FakeClock.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Returns:
+        FakeClock: The clock read by the monitor.
+    """
+    clock = FakeClock()
+    monkeypatch.setattr("src.monitor.time.monotonic_ns", clock)
+    return clock
+
 
 @pytest.fixture
 def mock_socket():
@@ -38,21 +94,31 @@ def mock_process_manager():
 
 
 @pytest.fixture
-def monitor_with_mocks(mock_socket, mock_process_manager):
+def monitor_with_mocks(mock_socket, mock_process_manager, monkeypatch):
     """Create a HeartbeatMonitor with mocked dependencies.
 
-    Sets up a HeartbeatMonitor instance with mocked socket and process
-    manager for isolated testing of monitor functionality.
+    Sets up a HeartbeatMonitor instance with mocked socket, selector, and process
+    manager for isolated testing of monitor functionality. The mocks are built
+    in place of the real socket and selector, so no port is bound per test.
+    Worker pidfds are disabled, since the mocked workers have no real process
+    behind them.
 
     Args:
         mock_socket: Mock socket fixture.
         mock_process_manager: Mock ProcessManager fixture.
+        monkeypatch: Pytest monkeypatch fixture.
 
     Returns:
         HeartbeatMonitor: Monitor instance with mocked dependencies.
     """
-    monitor = HeartbeatMonitor()
-    monitor._heartbeat_socket = mock_socket
+    monkeypatch.setattr("src.monitor._pidfd_open", None)
+    mock_selector = Mock(spec=selectors.BaseSelector)
+    mock_selector.select.return_value = []
+    with patch("src.monitor.socket.socket", return_value=mock_socket), patch(
+        "src.monitor.selectors.DefaultSelector", return_value=mock_selector
+    ):
+        monitor = HeartbeatMonitor()
+    mock_socket.reset_mock()
     monitor._process_manager = mock_process_manager
     return monitor
 
@@ -64,21 +130,102 @@ def test_initialization_default_values():
     including timeout threshold, duration, and proper socket setup.
     """
     mock_socket = Mock()
-    with patch("src.monitor.socket.socket", return_value=mock_socket):
+    with patch("src.monitor.socket.socket", return_value=mock_socket), patch(
+        "src.monitor.selectors.DefaultSelector"
+    ), patch("src.monitor.time.monotonic_ns", return_value=NOW_NS):
         monitor = HeartbeatMonitor()
 
         assert monitor._duration == 60
         assert monitor._timeout_threshold == 500
-        assert monitor._last_heartbeat is None
-        assert monitor._start_time is None
+        assert monitor._timeout_ns == 500_000_000
+        assert monitor._last_heartbeat == NOW_NS
+        assert monitor._start_time == 0
         assert monitor._heartbeat_socket == mock_socket
+        mock_socket.setsockopt.assert_called_once_with(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20
+        )
         assert monitor._process_manager is None
 
         mock_socket.bind.assert_called_once_with(("", 9999))
+
+
+@pytest.mark.parametrize("nonblock_flag", [0, 0o4000])
+def test_initialization_nonblocking_socket(nonblock_flag):
+    """Test that the heartbeat socket is always created non-blocking.
+
+    Verifies that the non-blocking flag is passed at socket creation when the
+    platform provides it, and that setblocking is used as a fallback otherwise.
+
+    Args:
+        nonblock_flag: Value of SOCK_NONBLOCK on the simulated platform.
+    """
+    with patch("src.monitor.socket.socket") as mock_socket_cls, patch(
+        "src.monitor.selectors.DefaultSelector"
+    ), patch("src.monitor._SOCK_NONBLOCK", nonblock_flag):
+        HeartbeatMonitor()
+
+    mock_socket_cls.assert_called_once_with(
+        socket.AF_INET, socket.SOCK_DGRAM | nonblock_flag
+    )
+    mock_socket = mock_socket_cls.return_value
+    if nonblock_flag:
+        mock_socket.setblocking.assert_not_called()
+    else:
         mock_socket.setblocking.assert_called_once_with(False)
 
 
-@pytest.mark.parametrize("duration", [30, 60, 120, 300])
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+def test_initialization_socket_path(tmp_path):
+    """Test that a configured socket path binds a Unix datagram socket.
+
+    A stale socket file left by an earlier run is replaced, and a heartbeat sent
+    to the path is received.
+
+    Args:
+        tmp_path: Pytest temporary directory fixture.
+    """
+    path = str(tmp_path / "heartbeat.sock")
+    open(path, "w").close()
+
+    with patch("src.monitor.HEARTBEAT_SOCKET_PATH", path):
+        monitor = HeartbeatMonitor()
+    sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        assert monitor._heartbeat_socket.family == socket.AF_UNIX
+        sender.sendto(struct.pack("<Q", 1), path)
+
+        with patch("src.monitor.time.monotonic_ns", return_value=NOW_NS):
+            monitor.receive_heartbeat()
+
+        assert monitor._last_heartbeat == NOW_NS
+    finally:
+        sender.close()
+        with patch("src.monitor.HEARTBEAT_SOCKET_PATH", path):
+            monitor.close()
+
+    assert not os.path.exists(path)
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+@pytest.mark.parametrize("cpu,expected_calls", [(-1, []), (2, [((0, {2}),)])])
+def test_initialization_cpu_affinity(cpu, expected_calls):
+    """Test that the monitor pins itself only when a CPU is configured.
+
+    Args:
+        cpu: Configured MONITOR_CPU value.
+        expected_calls: Expected os.sched_setaffinity calls.
+    """
+    with patch("src.monitor.socket.socket"), patch(
+        "src.monitor.selectors.DefaultSelector"
+    ), patch("src.monitor.MONITOR_CPU", cpu), patch(
+        "src.monitor.os.sched_setaffinity"
+    ) as mock_setaffinity:
+        HeartbeatMonitor()
+
+    assert mock_setaffinity.call_args_list == expected_calls
+
+
+@pytest.mark.parametrize("duration", [30, 300])
 def test_initialization_custom_duration(duration):
     """Test HeartbeatMonitor initialization with custom duration values.
 
@@ -89,7 +236,9 @@ def test_initialization_custom_duration(duration):
         duration: Custom duration value to test.
     """
     mock_socket = Mock()
-    with patch("src.monitor.socket.socket", return_value=mock_socket):
+    with patch("src.monitor.socket.socket", return_value=mock_socket), patch(
+        "src.monitor.selectors.DefaultSelector"
+    ):
         monitor = HeartbeatMonitor(duration=duration)
 
         assert monitor._duration == duration
@@ -105,18 +254,186 @@ def test_receive_heartbeat_success(monitor_with_mocks, mocker):
         monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
     """
     mock_socket = monitor_with_mocks._heartbeat_socket
-    mock_socket.recvfrom.return_value = (b"heartbeat", ("127.0.0.1", 5000))
+    mock_socket.recv_into.side_effect = [
+        8,
+        BlockingIOError(),
+    ]
+    mock_logger = mocker.patch("src.monitor.logger")
+
+    with patch("src.monitor.time.monotonic_ns", return_value=NOW_NS):
+        monitor_with_mocks.receive_heartbeat()
+
+    assert monitor_with_mocks._last_heartbeat == NOW_NS
+    assert mock_socket.recv_into.call_count == 2
+    mock_logger.debug.assert_called_once_with("Heartbeat received.")
+
+
+def test_receive_heartbeat_drains_queued_messages(monitor_with_mocks, mocker):
+    """Test that all queued heartbeats are consumed in a single call.
+
+    Verifies that the receive path reads until the socket would block and
+    records the heartbeat timestamp only once for the whole batch.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+    """
+    mock_socket = monitor_with_mocks._heartbeat_socket
+    mock_socket.recv_into.side_effect = [
+        8,
+        8,
+        8,
+        BlockingIOError(),
+    ]
+    mock_logger = mocker.patch("src.monitor.logger")
+
+    with patch(
+        "src.monitor.time.monotonic_ns", return_value=NOW_NS
+    ) as mock_monotonic_ns:
+        monitor_with_mocks.receive_heartbeat()
+
+    assert mock_socket.recv_into.call_count == 4
+    mock_monotonic_ns.assert_called_once()
+    mock_logger.debug.assert_called_once()
+
+
+def test_receive_heartbeat_uses_batch_receiver(monitor_with_mocks, mocker):
+    """Test that batched reception replaces per-datagram reads when enabled.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+    """
+    mocker.patch("src.monitor.logger")
+    monitor_with_mocks._batch_receiver = Mock()
+    monitor_with_mocks._batch_receiver.drain.return_value = 3
+
+    with patch("src.monitor.time.monotonic_ns", return_value=NOW_NS):
+        monitor_with_mocks.receive_heartbeat()
+
+    monitor_with_mocks._batch_receiver.drain.assert_called_once_with()
+    monitor_with_mocks._heartbeat_socket.recv_into.assert_not_called()
+    assert monitor_with_mocks._last_heartbeat == NOW_NS
+
+
+@pytest.mark.skipif(
+    not hasattr(socket, "CMSG_SPACE"), reason="Control messages are POSIX-only"
+)
+def test_initialization_kernel_timestamps():
+    """Test that kernel arrival timestamps are requested when enabled."""
+    with patch("src.monitor.socket.socket") as mock_socket_cls, patch(
+        "src.monitor.selectors.DefaultSelector"
+    ), patch("src.monitor.HEARTBEAT_KERNEL_TIMESTAMPS", 1), patch(
+        "src.monitor._SO_TIMESTAMPNS", 35
+    ):
+        monitor = HeartbeatMonitor()
+
+    mock_socket_cls.return_value.setsockopt.assert_any_call(socket.SOL_SOCKET, 35, 1)
+    assert monitor._ancbufsize == socket.CMSG_SPACE(struct.calcsize("@ll"))
+
+
+def test_initialization_kernel_timestamps_unknown_option(mocker):
+    """Test that kernel timestamps are disabled where SO_TIMESTAMPNS is unknown.
+
+    Args:
+        mocker: Pytest mocker fixture for patching dependencies.
+    """
+    mock_socket_cls = mocker.patch("src.monitor.socket.socket")
+    mocker.patch("src.monitor.selectors.DefaultSelector")
+    mocker.patch("src.monitor.HEARTBEAT_KERNEL_TIMESTAMPS", 1)
+    mocker.patch("src.monitor._SO_TIMESTAMPNS", 0)
     mock_logger = mocker.patch("src.monitor.logger")
 
-    with patch("src.monitor.datetime") as mock_datetime:
-        mock_now = datetime(2025, 7, 5, 12, 0, 0)
-        mock_datetime.now.return_value = mock_now
+    monitor = HeartbeatMonitor()
+
+    assert monitor._ancbufsize == 0
+    assert not any(
+        args[:2] == (socket.SOL_SOCKET, 0)
+        for args, _ in mock_socket_cls.return_value.setsockopt.call_args_list
+    )
+    mock_logger.warning.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "exported,machine,expected",
+    [
+        (None, "x86_64", 35),  # asm-generic value
+        (None, "sparc64", 0),  # different numbering: do not guess
+        (None, "parisc", 0),
+        (0x4007, "parisc", 0x4007),  # exported by the socket module
+    ],
+)
+def test_so_timestampns_value(monkeypatch, exported, machine, expected):
+    """Test that SO_TIMESTAMPNS is only assumed on asm-generic architectures.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        exported: Value exported by the socket module, or None if missing.
+        machine: Machine name reported by os.uname().
+        expected: Expected option number.
+    """
+    if exported is None:
+        monkeypatch.delattr(socket, "SO_TIMESTAMPNS", raising=False)
+    else:
+        monkeypatch.setattr(socket, "SO_TIMESTAMPNS", exported, raising=False)
+    monkeypatch.setattr("src.monitor.sys.platform", "linux")
+    monkeypatch.setattr(
+        "src.monitor.os.uname", lambda: Mock(machine=machine), raising=False
+    )
+
+    assert monitor_module._so_timestampns() == expected
+
+
+def test_receive_heartbeat_kernel_timestamp(monitor_with_mocks, mocker):
+    """Test that the newest kernel arrival time becomes the heartbeat time.
 
+    The kernel stamps are wall-clock times, so they are shifted by the offset
+    between the wall clock and the monotonic clock.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+    """
+    mocker.patch("src.monitor.logger")
+    mocker.patch("src.monitor._SO_TIMESTAMPNS", 35)
+    monitor_with_mocks._ancbufsize = 32
+    wall_offset_ns = 5_000_000_000_000
+
+    def stamp(arrival_ns):
+        data = struct.pack("@ll", *divmod(wall_offset_ns + arrival_ns, 1_000_000_000))
+        return (8, [(socket.SOL_SOCKET, 35, data)], 0, None)
+
+    mock_socket = monitor_with_mocks._heartbeat_socket
+    mock_socket.recvmsg_into.side_effect = [
+        stamp(NOW_NS - 3_000_000),
+        stamp(NOW_NS - 2_000_000),
+        BlockingIOError(),
+    ]
+
+    with patch("src.monitor.time.monotonic_ns", return_value=NOW_NS), patch(
+        "src.monitor.time.time_ns", return_value=wall_offset_ns + NOW_NS
+    ):
+        monitor_with_mocks.receive_heartbeat()
+
+    assert monitor_with_mocks._last_heartbeat == NOW_NS - 2_000_000
+    mock_socket.recvmsg_into.assert_called_with([monitor_with_mocks._rx_buffer], 32)
+    mock_socket.recv_into.assert_not_called()
+
+
+def test_receive_heartbeat_without_kernel_timestamp(monitor_with_mocks, mocker):
+    """Test that the receive time is used when no timestamp is delivered.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+    """
+    mocker.patch("src.monitor.logger")
+    monitor_with_mocks._ancbufsize = 32
+    monitor_with_mocks._heartbeat_socket.recvmsg_into.side_effect = [
+        (8, [], 0, None),
+        BlockingIOError(),
+    ]
+
+    with patch("src.monitor.time.monotonic_ns", return_value=NOW_NS):
         monitor_with_mocks.receive_heartbeat()
 
-        assert monitor_with_mocks._last_heartbeat == mock_now
-        mock_socket.recvfrom.assert_called_once_with(1024)
-        mock_logger.info.assert_called_once_with(f"Heartbeat received at {mock_now}")
+    assert monitor_with_mocks._last_heartbeat == NOW_NS
 
 
 def test_receive_heartbeat_socket_error(monitor_with_mocks):
@@ -129,7 +446,7 @@ def test_receive_heartbeat_socket_error(monitor_with_mocks):
         monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
     """
     mock_socket = monitor_with_mocks._heartbeat_socket
-    mock_socket.recvfrom.side_effect = socket.error("No data available")
+    mock_socket.recv_into.side_effect = socket.error("No data available")
 
     original_heartbeat = monitor_with_mocks._last_heartbeat
 
@@ -137,20 +454,18 @@ def test_receive_heartbeat_socket_error(monitor_with_mocks):
 
     # Should not change last_heartbeat on socket error
     assert monitor_with_mocks._last_heartbeat == original_heartbeat
-    mock_socket.recvfrom.assert_called_once_with(1024)
+    mock_socket.recv_into.assert_called_once_with(monitor_with_mocks._rx_buffer)
 
 
 def test_check_timeout_no_heartbeat_received(monitor_with_mocks):
     """Test timeout check when no heartbeat has been received.
 
-    Verifies that the timeout check correctly handles the case where
-    no heartbeat has been received yet.
+    Verifies that a freshly constructed monitor, which has not received a
+    heartbeat yet, is not considered timed out.
 
     Args:
         monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
     """
-    monitor_with_mocks._last_heartbeat = None
-
     result = monitor_with_mocks.check_timeout()
 
     assert result is False
@@ -166,7 +481,7 @@ def test_check_timeout_within_threshold(monitor_with_mocks):
         monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
     """
     # Set heartbeat to current time (well within threshold)
-    monitor_with_mocks._last_heartbeat = datetime.now()
+    monitor_with_mocks._last_heartbeat = time.monotonic_ns()
 
     result = monitor_with_mocks.check_timeout()
 
@@ -183,7 +498,7 @@ def test_check_timeout_exceeds_threshold(monitor_with_mocks):
         monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
     """
     # Set heartbeat to 1 second ago (exceeds 500ms threshold)
-    monitor_with_mocks._last_heartbeat = datetime.now() - timedelta(seconds=1)
+    monitor_with_mocks._last_heartbeat = time.monotonic_ns() - 1_000_000_000
 
     result = monitor_with_mocks.check_timeout()
 
@@ -210,13 +525,52 @@ def test_check_timeout_various_delays(
         seconds_ago: How many seconds ago the heartbeat was received.
         expected_timeout: Whether timeout should be detected.
     """
-    monitor_with_mocks._last_heartbeat = datetime.now() - timedelta(seconds=seconds_ago)
+    monitor_with_mocks._last_heartbeat = NOW_NS - int(seconds_ago * 1e9)
 
-    result = monitor_with_mocks.check_timeout()
+    result = monitor_with_mocks.check_timeout(NOW_NS)
 
     assert result == expected_timeout
 
 
+def test_check_timeout_uses_supplied_time(monitor_with_mocks):
+    """Tests that a caller-supplied timestamp is used instead of the clock.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+    """
+    monitor_with_mocks._last_heartbeat = NOW_NS
+
+    with patch("src.monitor.time.monotonic_ns") as mock_monotonic_ns:
+        assert monitor_with_mocks.check_timeout(NOW_NS + 400_000_000) is False
+        assert monitor_with_mocks.check_timeout(NOW_NS + 600_000_000) is True
+
+    mock_monotonic_ns.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "seconds_ago,expected_remaining",
+    [
+        (0.0, 0.5),  # Fresh heartbeat - full threshold
+        (0.2, 0.3),  # Part of the budget consumed
+        (1.0, 0.0),  # Already timed out - never negative
+    ],
+)
+def test_time_until_timeout(monitor_with_mocks, seconds_ago, expected_remaining):
+    """Tests the selector timeout derived from the last heartbeat.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+        seconds_ago: How many seconds ago the heartbeat was received.
+        expected_remaining: Expected seconds until the timeout fires.
+    """
+    monitor_with_mocks._last_heartbeat = NOW_NS - int(seconds_ago * 1e9)
+
+    with patch("src.monitor.time.monotonic_ns", return_value=NOW_NS):
+        remaining = monitor_with_mocks.time_until_timeout()
+
+    assert remaining == pytest.approx(expected_remaining)
+
+
 def test_restart_process(monitor_with_mocks, mocker):
     """Tests process restart functionality.
 
@@ -226,130 +580,359 @@ def test_restart_process(monitor_with_mocks, mocker):
     mock_pm = monitor_with_mocks._process_manager
     mock_logger = mocker.patch("src.monitor.logger")
 
-    with patch("src.monitor.datetime") as mock_datetime:
-        mock_now = datetime(2025, 7, 5, 12, 0, 0)
-        mock_datetime.now.return_value = mock_now
+    with patch("src.monitor.time.monotonic_ns", return_value=NOW_NS):
+        monitor_with_mocks.restart_process()
+
+    mock_pm.restart_process.assert_called_once()
+    assert monitor_with_mocks._last_heartbeat == NOW_NS
+    mock_logger.info.assert_called_once_with(
+        "Process restarted and heartbeat tracking reset."
+    )
+
+
+def test_restart_process_after_close(monitor_with_mocks):
+    """Tests that a closed monitor refuses to restart the detector.
 
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+    """
+    monitor_with_mocks._heartbeat_socket.fileno.return_value = -1
+
+    with pytest.raises(RuntimeError, match="Heartbeat socket is closed"):
         monitor_with_mocks.restart_process()
 
-        mock_pm.restart_process.assert_called_once()
-        assert monitor_with_mocks._last_heartbeat == mock_now
-        mock_logger.info.assert_called_once_with(
-            "Process restarted and heartbeat tracking reset."
-        )
+    monitor_with_mocks._process_manager.restart_process.assert_not_called()
 
 
-def test_restart_process_no_process_manager(mocker):
+def test_close(monitor_with_mocks):
+    """Tests that close releases the socket, selector, and worker pidfd.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+    """
+    with patch.object(monitor_with_mocks, "_watch_worker") as mock_watch:
+        monitor_with_mocks.close()
+
+    mock_watch.assert_called_once_with(None)
+    monitor_with_mocks._selector.close.assert_called_once_with()
+    monitor_with_mocks._heartbeat_socket.close.assert_called_once_with()
+
+
+def test_restart_process_no_process_manager(monitor_with_mocks, mocker):
     """Test restart_process when process_manager is None.
 
     Verifies that the restart_process method handles the case where
     process_manager is None by logging an error message without crashing.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
     """
-    mock_socket = Mock()
     mock_logger = mocker.patch("src.monitor.logger")
-    with patch("src.monitor.socket.socket", return_value=mock_socket):
-        monitor = HeartbeatMonitor()
-        monitor._process_manager = None  # Explicitly set to None
+    monitor_with_mocks._process_manager = None
 
-        monitor.restart_process()
+    monitor_with_mocks.restart_process()
 
-        mock_logger.error.assert_called_once_with(
-            "Error: ProcessManager not available for restart."
-        )
+    mock_logger.error.assert_called_once_with(
+        "Error: ProcessManager not available for restart."
+    )
 
 
-@patch("src.monitor.time.sleep")
-@patch("src.monitor.time.time")
-def test_start_monitoring_duration_reached(
-    mock_time, mock_sleep, monitor_with_mocks, mocker
-):
+def test_start_monitoring_duration_reached(fake_clock, monitor_with_mocks, mocker):
     """Tests start_monitoring when duration is reached.
 
     Args:
-        mock_time: Mock time.time function.
-        mock_sleep: Mock time.sleep function.
+        fake_clock: Clock read by the monitor.
         monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
     """
     mock_pm = monitor_with_mocks._process_manager
     cmd = ["python", "test.py"]
     mock_logger = mocker.patch("src.monitor.logger")
 
-    # Mock time progression: start=0, first check=0, second check=65 (exceeds duration=60)
-    mock_time.side_effect = [0, 0, 65]
-
-    with patch("src.monitor.datetime") as mock_datetime:
-        mock_now = datetime(2025, 7, 5, 12, 0, 0)
-        mock_datetime.now.return_value = mock_now
+    # The first wakeup comes 65s in, past the 60s duration
+    monitor_with_mocks._selector.select.side_effect = lambda timeout: (
+        fake_clock.advance(65) or []
+    )
 
-        with patch.object(monitor_with_mocks, "receive_heartbeat"), patch.object(
-            monitor_with_mocks, "check_timeout", return_value=False
-        ):
-            monitor_with_mocks.start_monitoring(cmd)
+    with patch.object(monitor_with_mocks, "receive_heartbeat"), patch.object(
+        monitor_with_mocks, "check_timeout", return_value=False
+    ) as mock_check_timeout:
+        monitor_with_mocks.start_monitoring(cmd)
 
     mock_pm.start_process.assert_called_once_with(cmd)
     mock_pm.shutdown_system.assert_called_once()
-    assert monitor_with_mocks._last_heartbeat == mock_now
-    assert monitor_with_mocks._start_time == 0
+    monitor_with_mocks._selector.register.assert_any_call(
+        monitor_with_mocks._heartbeat_socket, selectors.EVENT_READ
+    )
+    monitor_with_mocks._selector.select.assert_called_once_with(timeout=0.5)
+    mock_check_timeout.assert_called_once_with(NOW_NS + 65_000_000_000)
+    assert monitor_with_mocks._last_heartbeat == NOW_NS
+    assert monitor_with_mocks._start_time == NOW_NS
     mock_logger.info.assert_called_with("Monitoring duration reached. Shutting down.")
 
 
-@patch("src.monitor.time.sleep")
-@patch("src.monitor.time.time")
-def test_start_monitoring_with_timeout(
-    mock_time, mock_sleep, monitor_with_mocks, mocker
-):
+def test_start_monitoring_with_timeout(fake_clock, monitor_with_mocks, mocker):
     """Tests start_monitoring when timeout is detected.
 
     Args:
-        mock_time: Mock time.time function.
-        mock_sleep: Mock time.sleep function.
+        fake_clock: Clock read by the monitor.
         monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
     """
     mock_pm = monitor_with_mocks._process_manager
     cmd = ["python", "test.py"]
     mocker.patch("src.monitor.logger")
 
-    # Mock time to stay within duration
-    mock_time.side_effect = [0, 0, 30, 65]  # Last value triggers duration exit
-
-    with patch("src.monitor.datetime") as mock_datetime:
-        mock_now = datetime(2025, 7, 5, 12, 0, 0)
-        mock_datetime.now.return_value = mock_now
+    # Wakeups at 40s (timeout, restart) and 80s (past the 60s duration)
+    monitor_with_mocks._selector.select.side_effect = lambda timeout: (
+        fake_clock.advance(40) or []
+    )
 
-        with patch.object(monitor_with_mocks, "receive_heartbeat"), patch.object(
-            monitor_with_mocks, "check_timeout", side_effect=[True, False]
-        ), patch.object(monitor_with_mocks, "restart_process") as mock_restart:
-            monitor_with_mocks.start_monitoring(cmd)
+    with patch.object(monitor_with_mocks, "receive_heartbeat"), patch.object(
+        monitor_with_mocks, "check_timeout", side_effect=[True, False]
+    ), patch.object(monitor_with_mocks, "restart_process") as mock_restart:
+        monitor_with_mocks.start_monitoring(cmd)
 
     mock_pm.start_process.assert_called_once_with(cmd)
     mock_restart.assert_called_once()
     mock_pm.shutdown_system.assert_called_once()
 
 
-def test_start_monitoring_skips_terminate_when_no_worker(monkeypatch, mock_socket):
+def test_start_monitoring_skips_receive_without_events(monitor_with_mocks, mocker):
+    """Tests that the socket is only read when the selector reports readiness.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
     """
-    Tests that start_monitoring does not call terminate_process when no worker_process exists.
+    mocker.patch("src.monitor.logger")
+    mocker.patch("src.monitor.time.monotonic_ns", side_effect=[0, 65_000_000_000])
+    monitor_with_mocks._selector.select.return_value = []
+
+    with patch.object(
+        monitor_with_mocks, "receive_heartbeat"
+    ) as mock_receive, patch.object(
+        monitor_with_mocks, "check_timeout", return_value=False
+    ):
+        monitor_with_mocks.start_monitoring(["python", "test.py"])
+
+    monitor_with_mocks._selector.select.assert_called_once()
+    mock_receive.assert_not_called()
+
+
+def test_start_monitoring_busy_wait(monitor_with_mocks, mocker):
+    """Tests that busy-wait mode polls without blocking and yields when idle.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
     """
-    from unittest.mock import Mock
+    mocker.patch("src.monitor.logger")
+    mocker.patch("src.monitor.MONITOR_BUSY_WAIT", 1)
+    mock_yield = mocker.patch("src.monitor._sched_yield")
+    mocker.patch(
+        "src.monitor.time.monotonic_ns", side_effect=[0, 1_000, 65_000_000_000]
+    )
 
-    from src.monitor import HeartbeatMonitor
+    with patch.object(monitor_with_mocks, "receive_heartbeat"), patch.object(
+        monitor_with_mocks, "check_timeout", return_value=False
+    ):
+        monitor_with_mocks.start_monitoring(["python", "test.py"])
 
-    # Setup mock process manager with no worker_process
-    mock_pm = Mock()
-    mock_pm.worker_process = None
+    assert monitor_with_mocks._selector.select.call_args_list == [
+        ((), {"timeout": 0.0}),
+        ((), {"timeout": 0.0}),
+    ]
+    assert mock_yield.call_count == 2
 
-    # Patch socket.socket to use our mock
-    monkeypatch.setattr(
-        "src.monitor.socket.socket", lambda *args, **kwargs: mock_socket
+
+def test_start_monitoring_restarts_on_worker_exit(monitor_with_mocks, mocker):
+    """Tests that a readable worker pidfd restarts the process without a timeout.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+    """
+    mock_logger = mocker.patch("src.monitor.logger")
+    mocker.patch(
+        "src.monitor.time.monotonic_ns", side_effect=[0, 1_000_000, 65_000_000_000]
+    )
+    monitor_with_mocks._worker_pidfd = 42
+    exit_key = selectors.SelectorKey(42, 42, selectors.EVENT_READ, None)
+    monitor_with_mocks._selector.select.side_effect = [
+        [(exit_key, selectors.EVENT_READ)],
+        [],
+    ]
+
+    with patch.object(monitor_with_mocks, "_watch_worker"), patch.object(
+        monitor_with_mocks, "receive_heartbeat"
+    ) as mock_receive, patch.object(
+        monitor_with_mocks, "check_timeout", return_value=False
+    ) as mock_check_timeout, patch.object(
+        monitor_with_mocks, "restart_process"
+    ) as mock_restart:
+        monitor_with_mocks.start_monitoring(["python", "test.py"])
+
+    mock_restart.assert_called_once_with()
+    mock_receive.assert_not_called()
+    mock_check_timeout.assert_called_once_with(65_000_000_000)
+    mock_logger.warning.assert_called_once_with(
+        "Detector process exited. Restarting process..."
     )
 
-    # Simulate time advancing past duration immediately
-    times = iter([0, 2])
-    monkeypatch.setattr("src.monitor.time.time", lambda: next(times))
 
-    monitor = HeartbeatMonitor(duration=1)
-    monitor._heartbeat_socket = mock_socket
+def test_start_monitoring_shuts_down_on_signal(monitor_with_mocks, mocker):
+    """Tests that SIGTERM wakes the selector and shuts the system down.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+    """
+    mock_logger = mocker.patch("src.monitor.logger")
+    mocker.patch("src.monitor.time.monotonic_ns", return_value=0)
+    selector = monitor_with_mocks._selector
+    previous_handler = signal.getsignal(signal.SIGTERM)
+
+    def signal_and_select(timeout):
+        # The wakeup socket is the last object registered before the loop starts
+        reader = selector.register.call_args[0][0]
+        signal.raise_signal(signal.SIGTERM)
+        assert select.select([reader], [], [], 1)[0] == [reader]
+        key = selectors.SelectorKey(reader, reader.fileno(), selectors.EVENT_READ, None)
+        return [(key, selectors.EVENT_READ)]
+
+    selector.select.side_effect = signal_and_select
+
+    with patch.object(
+        monitor_with_mocks, "receive_heartbeat"
+    ) as mock_receive, patch.object(
+        monitor_with_mocks, "restart_process"
+    ) as mock_restart:
+        monitor_with_mocks.start_monitoring(["python", "test.py"])
+
+    mock_receive.assert_not_called()
+    mock_restart.assert_not_called()
+    monitor_with_mocks._process_manager.shutdown_system.assert_called_once_with()
+    mock_logger.info.assert_called_with("Shutdown signal received. Shutting down.")
+    assert signal.getsignal(signal.SIGTERM) is previous_handler
+    assert signal.set_wakeup_fd(-1) == -1
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="POSIX signals only")
+def test_start_monitoring_ignores_other_signals(fake_clock, monitor_with_mocks, mocker):
+    """Tests that a non-shutdown signal on the wakeup socket does not stop monitoring.
+
+    Any signal with a Python handler is written to the wakeup socket, not just
+    SIGINT and SIGTERM.
+
+    Args:
+        fake_clock: Clock read by the monitor.
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+    """
+    mock_logger = mocker.patch("src.monitor.logger")
+    selector = monitor_with_mocks._selector
+    previous_handler = signal.signal(signal.SIGUSR1, lambda signum, frame: None)
+
+    def signal_then_expire(timeout):
+        reader = selector.register.call_args[0][0]
+        if selector.select.call_count == 1:
+            signal.raise_signal(signal.SIGUSR1)
+            key = selectors.SelectorKey(
+                reader, reader.fileno(), selectors.EVENT_READ, None
+            )
+            return [(key, selectors.EVENT_READ)]
+        fake_clock.advance(65)
+        return []
+
+    selector.select.side_effect = signal_then_expire
+
+    try:
+        with patch.object(monitor_with_mocks, "restart_process"):
+            monitor_with_mocks.start_monitoring(["python", "test.py"])
+    finally:
+        signal.signal(signal.SIGUSR1, previous_handler)
+
+    assert selector.select.call_count == 2
+    mock_logger.info.assert_called_with("Monitoring duration reached. Shutting down.")
+
+
+def test_shutdown_runs_with_default_signal_handlers(monitor_with_mocks, mocker):
+    """Tests that shutdown starts after the signal wakeup handlers are removed.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+    """
+    mocker.patch("src.monitor.logger")
+    mocker.patch("src.monitor.time.monotonic_ns", return_value=0)
+    monitor_with_mocks._duration = -1
+    previous_handler = signal.getsignal(signal.SIGINT)
+    seen = []
+    monitor_with_mocks._process_manager.shutdown_system.side_effect = lambda: (
+        seen.append(signal.getsignal(signal.SIGINT))
+    )
+
+    monitor_with_mocks.start_monitoring(["python", "test.py"])
+
+    assert seen == [previous_handler]
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="Requires pidfd support")
+def test_watch_worker_wakes_selector_on_exit(monitor_with_mocks, monkeypatch):
+    """Tests that a watched worker's exit makes its pidfd readable.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr("src.monitor._pidfd_open", os.pidfd_open)
+    monitor_with_mocks._selector = selectors.DefaultSelector()
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    try:
+        monitor_with_mocks._watch_worker(proc)
+        pidfd = monitor_with_mocks._worker_pidfd
+
+        events = monitor_with_mocks._selector.select(timeout=10)
+
+        assert [key.fd for key, _ in events] == [pidfd]
+        monitor_with_mocks._watch_worker(None)
+        assert monitor_with_mocks._worker_pidfd is None
+        assert not monitor_with_mocks._selector.get_map()
+    finally:
+        proc.wait()
+        monitor_with_mocks._selector.close()
+
+
+def test_watch_worker_without_pidfd(monitor_with_mocks, monkeypatch):
+    """Tests that a worker that cannot be watched leaves only the timeout.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr("src.monitor._pidfd_open", Mock(side_effect=ProcessLookupError))
+
+    monitor_with_mocks._watch_worker(Mock(pid=12345))
+
+    assert monitor_with_mocks._worker_pidfd is None
+    monitor_with_mocks._selector.register.assert_not_called()
+
+
+def test_start_monitoring_skips_terminate_when_no_worker(
+    monitor_with_mocks, monkeypatch
+):
+    """
+    Tests that start_monitoring does not call terminate_process when no worker_process exists.
+
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    # Setup mock process manager with no worker_process
+    mock_pm = Mock()
+    mock_pm._worker_process = None
+
+    monitor = monitor_with_mocks
+    monitor._duration = 1
     monitor._process_manager = mock_pm
+    monkeypatch.setattr(monitor, "check_timeout", lambda now_ns=None: False)
+
+    # Simulate time advancing past duration immediately
+    times = iter([0, 2_000_000_000])
+    monkeypatch.setattr("src.monitor.time.monotonic_ns", lambda: next(times))
 
     monitor.start_monitoring(["cmd"])
 
@@ -357,35 +940,38 @@ def test_start_monitoring_skips_terminate_when_no_worker(monkeypatch, mock_socke
     mock_pm.shutdown_system.assert_called_once()
 
 
-def test_start_monitoring_no_process_manager():
+def test_start_monitoring_no_process_manager(monitor_with_mocks):
     """Test that start_monitoring raises ValueError when process_manager is None.
 
     Verifies that the monitor properly validates that a ProcessManager is set
     before attempting to start monitoring operations.
-    """
-    mock_socket = Mock()
-    with patch("src.monitor.socket.socket", return_value=mock_socket):
-        monitor = HeartbeatMonitor()
-        # process_manager is None by default
 
-        cmd = ["python", "src/detector.py"]
+    Args:
+        monitor_with_mocks: HeartbeatMonitor with mocked dependencies.
+    """
+    monitor_with_mocks._process_manager = None
+    cmd = ["python", "src/detector.py"]
 
-        with pytest.raises(
-            ValueError,
-            match="ProcessManager not set. Must be configured by orchestrator.",
-        ):
-            monitor.start_monitoring(cmd)
+    with pytest.raises(
+        ValueError,
+        match="ProcessManager not set. Must be configured by orchestrator.",
+    ):
+        monitor_with_mocks.start_monitoring(cmd)
 
 
+@pytest.mark.integration
 class TestHeartbeatMonitorIntegration:
     """Integration tests for HeartbeatMonitor workflow scenarios."""
 
     @pytest.fixture
-    def monitor(self):
+    def monitor(self, monkeypatch):
         """Creates a HeartbeatMonitor for integration tests."""
+        monkeypatch.setattr("src.monitor._pidfd_open", None)
         mock_socket = Mock()
         with patch("src.monitor.socket.socket", return_value=mock_socket):
-            return HeartbeatMonitor()
+            monitor = HeartbeatMonitor()
+        yield monitor
+        monitor.close()
 
     def test_heartbeat_reception_workflow(self, monitor, mocker):
         """Tests the complete heartbeat reception workflow.
@@ -394,28 +980,22 @@ class TestHeartbeatMonitorIntegration:
             monitor: HeartbeatMonitor fixture.
         """
         # Test initial state
-        assert monitor._last_heartbeat is None
         assert monitor.check_timeout() is False
         mock_logger = mocker.patch("src.monitor.logger")
 
         # Simulate receiving heartbeat
-        monitor._heartbeat_socket.recvfrom.return_value = (
-            b"heartbeat",
-            ("127.0.0.1", 5000),
-        )
-
-        with patch("src.monitor.datetime") as mock_datetime:
-            mock_now = datetime(2025, 7, 5, 12, 0, 0)
-            mock_datetime.now.return_value = mock_now
+        monitor._heartbeat_socket.recv_into.side_effect = [
+            8,
+            BlockingIOError(),
+        ]
 
+        with patch("src.monitor.time.monotonic_ns", return_value=NOW_NS):
             monitor.receive_heartbeat()
 
             # Verify heartbeat was processed
-            assert monitor._last_heartbeat == mock_now
+            assert monitor._last_heartbeat == NOW_NS
             assert monitor.check_timeout() is False
-            mock_logger.info.assert_called_once_with(
-                f"Heartbeat received at {mock_now}"
-            )
+            mock_logger.debug.assert_called_once_with("Heartbeat received.")
 
     def test_timeout_detection_workflow(self, monitor, mocker):
         """Tests timeout detection and recovery workflow.
@@ -424,8 +1004,7 @@ class TestHeartbeatMonitorIntegration:
             monitor: HeartbeatMonitor fixture.
         """
         # Set up old heartbeat
-        old_time = datetime.now() - timedelta(seconds=1)
-        monitor._last_heartbeat = old_time
+        monitor._last_heartbeat = time.monotonic_ns() - 1_000_000_000
         mock_logger = mocker.patch("src.monitor.logger")
 
         # Should detect timeout
@@ -436,42 +1015,40 @@ class TestHeartbeatMonitorIntegration:
         monitor._process_manager = mock_pm
 
         # Simulate restart process
-        with patch("src.monitor.datetime") as mock_datetime:
-            new_time = datetime.now()
-            mock_datetime.now.return_value = new_time
-
+        with patch("src.monitor.time.monotonic_ns", return_value=NOW_NS):
             monitor.restart_process()
 
             # Should reset heartbeat and clear timeout
-            assert monitor._last_heartbeat == new_time
+            assert monitor._last_heartbeat == NOW_NS
             assert monitor.check_timeout() is False
             mock_pm.restart_process.assert_called_once()
             mock_logger.info.assert_called_once_with(
                 "Process restarted and heartbeat tracking reset."
             )
 
-    def test_socket_error_handling(self, monitor):
+    @pytest.mark.parametrize(
+        "error",
+        [
+            socket.error("Connection refused"),
+            socket.timeout("Socket timeout"),
+            OSError("Network unreachable"),
+        ],
+    )
+    def test_socket_error_handling(self, monitor, error):
         """Tests robust error handling for socket operations.
 
         Args:
             monitor: HeartbeatMonitor fixture.
+            error: Exception raised by the socket read.
         """
-        # Test various socket errors
-        error_types = [
-            socket.error("Connection refused"),
-            socket.timeout("Socket timeout"),
-            OSError("Network unreachable"),
-        ]
+        monitor._heartbeat_socket.recv_into.side_effect = error
+        original_heartbeat = monitor._last_heartbeat
 
-        for error in error_types:
-            monitor._heartbeat_socket.recvfrom.side_effect = error
-            original_heartbeat = monitor._last_heartbeat
-
-            # Should not raise exception
-            monitor.receive_heartbeat()
+        # Should not raise exception
+        monitor.receive_heartbeat()
 
-            # Should not change heartbeat state
-            assert monitor._last_heartbeat == original_heartbeat
+        # Should not change heartbeat state
+        assert monitor._last_heartbeat == original_heartbeat
 
     def test_configuration_validation(self, monitor):
         """Tests that monitor configuration is properly validated.
@@ -482,8 +1059,7 @@ class TestHeartbeatMonitorIntegration:
         # Test default configuration
         assert monitor._duration == 60
         assert monitor._timeout_threshold == 500
-        assert monitor._last_heartbeat is None
-        assert monitor._start_time is None
+        assert monitor._start_time == 0
 
         # Test socket configuration
         assert monitor._heartbeat_socket is not None
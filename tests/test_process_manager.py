@@ -5,22 +5,37 @@ covering process lifecycle operations, error handling, and state management
 with proper mocking and validation.
 """
 
+import os
 import subprocess
+import sys
 from unittest.mock import Mock, call, patch
 
 import pytest
 
-from src.process_manager import ProcessManager
+from src.process_manager import ProcessManager, _wait_for_exit
+
+
+@pytest.fixture(autouse=True)
+def no_pidfd(monkeypatch):
+    """Wait through Popen.wait(), since mocked processes have no real pid.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr("src.process_manager._pidfd_open", None)
 
 
 @pytest.fixture
 def process_manager():
     """Create and return a ProcessManager instance for testing.
 
-    Returns:
+    Yields:
         ProcessManager: A new ProcessManager instance with clean state.
     """
-    return ProcessManager()
+    manager = ProcessManager()
+    yield manager
+    if manager._devnull is not None:
+        os.close(manager._devnull)
 
 
 @pytest.fixture
@@ -46,6 +61,7 @@ def test_initialization(process_manager):
         process_manager (ProcessManager): Fixture providing a clean manager.
     """
     assert process_manager._worker_cmd is None
+    assert process_manager._worker_cmd_str == ""
     assert process_manager._worker_process is None
     assert process_manager._monitor is None
     assert process_manager._duration == 60
@@ -71,19 +87,43 @@ def test_start_process(mock_logger, mock_popen, process_manager, mock_process):
     mock_popen.return_value = mock_process
     cmd = ["python", "worker.py"]
 
-    result = process_manager.start_process(cmd)
+    with patch("shutil.which", return_value="/usr/bin/python") as mock_which:
+        result = process_manager.start_process(cmd)
 
-    assert process_manager._worker_cmd == cmd
+    mock_which.assert_called_once_with("python")
+    assert process_manager._worker_cmd == ("/usr/bin/python", "worker.py")
+    assert process_manager._worker_cmd_str == "python worker.py"
     assert process_manager._worker_process == mock_process
     assert result == mock_process
     mock_popen.assert_called_once_with(
-        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        ("/usr/bin/python", "worker.py"),
+        stdout=process_manager._devnull,
+        stderr=process_manager._devnull,
+        start_new_session=True,
     )
     mock_logger.info.assert_called_once_with(
-        "Starting worker process with command: python worker.py"
+        "Starting worker process with command: %s", "python worker.py"
     )
 
 
+@patch("subprocess.Popen")
+@patch("src.process_manager.logger")
+def test_start_process_keeps_unresolvable_executable(
+    mock_logger, mock_popen, process_manager
+):
+    """Verify an executable missing from PATH is passed through unchanged.
+
+    Args:
+        mock_logger (Mock): Mock for logger.
+        mock_popen (Mock): Mock for subprocess.Popen.
+        process_manager (ProcessManager): Fixture providing a manager.
+    """
+    with patch("shutil.which", return_value=None):
+        process_manager.start_process(["missing-tool", "--flag"])
+
+    assert process_manager._worker_cmd == ("missing-tool", "--flag")
+
+
 @pytest.mark.parametrize(
     "cmd,expected_message",
     [
@@ -123,7 +163,8 @@ def test_start_process_with_various_commands(
 
     process_manager.start_process(cmd)
 
-    mock_logger.info.assert_called_once_with(expected_message)
+    message, *args = mock_logger.info.call_args.args
+    assert message % tuple(args) == expected_message
 
 
 def test_restart_process_no_command_stored(process_manager):
@@ -161,7 +202,8 @@ def test_restart_process_no_existing_process(
         subprocess.Popen: The newly started mock process.
     """
     mock_popen.return_value = mock_process
-    process_manager._worker_cmd = ["python", "worker.py"]
+    process_manager._worker_cmd = ("python", "worker.py")
+    process_manager._worker_cmd_str = "python worker.py"
     process_manager._worker_process = None
 
     result = process_manager.restart_process()
@@ -169,10 +211,13 @@ def test_restart_process_no_existing_process(
     assert result == mock_process
     assert process_manager._worker_process == mock_process
     mock_popen.assert_called_once_with(
-        ["python", "worker.py"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        ("python", "worker.py"),
+        stdout=process_manager._devnull,
+        stderr=process_manager._devnull,
+        start_new_session=True,
     )
     mock_logger.info.assert_called_once_with(
-        "Restarting worker process with command: python worker.py"
+        "Restarting worker process with command: %s", "python worker.py"
     )
 
 
@@ -196,21 +241,44 @@ def test_restart_process_with_running_process(mock_logger, mock_popen, process_m
     mock_new_process = Mock()
     mock_popen.return_value = mock_new_process
 
-    process_manager._worker_cmd = ["python", "worker.py"]
+    process_manager._worker_cmd = ("python", "worker.py")
+    process_manager._worker_cmd_str = "python worker.py"
     process_manager._worker_process = mock_old_process
 
-    with patch.object(
-        process_manager, "is_process_running", return_value=True
-    ), patch.object(process_manager, "terminate_process") as mock_terminate:
+    with patch.object(ProcessManager, "_terminate_running") as mock_terminate:
         result = process_manager.restart_process()
 
         assert result == mock_new_process
         assert process_manager._worker_process == mock_new_process
         mock_terminate.assert_called_once_with(mock_old_process)
-        mock_logger.info.assert_any_call("Terminating existing worker process...")
-        mock_logger.info.assert_any_call(
-            "Restarting worker process with command: python worker.py"
-        )
+        mock_old_process.poll.assert_called_once_with()
+        assert mock_logger.info.call_args_list == [
+            call("Terminating existing worker process..."),
+            call("Restarting worker process with command: %s", "python worker.py"),
+        ]
+
+
+@patch("subprocess.Popen")
+def test_restart_process_polls_old_worker_once(mock_popen, process_manager):
+    """Verify a restart checks the old worker's state with a single poll().
+
+    Args:
+        mock_popen (Mock): Mock for subprocess.Popen.
+        process_manager (ProcessManager): Fixture providing a manager.
+    """
+    mock_old_process = Mock()
+    mock_old_process.poll.return_value = None
+    mock_old_process.wait.return_value = 0
+
+    process_manager._worker_cmd = ("python", "worker.py")
+    process_manager._worker_cmd_str = "python worker.py"
+    process_manager._worker_process = mock_old_process
+
+    process_manager.restart_process()
+
+    mock_old_process.poll.assert_called_once_with()
+    mock_old_process.terminate.assert_called_once_with()
+    mock_old_process.wait.assert_called_once_with(timeout=5)
 
 
 @pytest.mark.parametrize(
@@ -254,7 +322,7 @@ def test_is_process_running_no_process(process_manager):
     Args:
         process_manager (ProcessManager): Fixture providing a manager.
     """
-    process_manager.worker_process = None
+    process_manager._worker_process = None
 
     result = process_manager.is_process_running()
 
@@ -297,99 +365,56 @@ def test_terminate_process_graceful_shutdown(process_manager):
     mock_process.wait.assert_called_once_with(timeout=5)
 
 
-def test_terminate_process_forced_shutdown(process_manager):
-    """Verify terminate_process forces shutdown if graceful termination times out.
-
-    Tests that the process termination correctly handles timeout scenarios
-    by forcing process termination when graceful shutdown fails.
-
-    Args:
-        process_manager (ProcessManager): Fixture providing a manager.
-    """
-    mock_process = Mock()
-    mock_process.poll.return_value = None
-    mock_process.wait.side_effect = [
-        subprocess.TimeoutExpired(cmd="test", timeout=5),
-        None,  # Second call succeeds after kill()
-    ]
-    mock_process.pid = 12345
-
-    process_manager.terminate_process(mock_process)
-
-    mock_process.poll.assert_called_once()
-    mock_process.terminate.assert_called_once()
-    # Should call wait twice: once with timeout=5, then once with timeout=2
-    expected_calls = [call(timeout=5), call(timeout=2)]
-    mock_process.wait.assert_has_calls(expected_calls)
-    # Should call kill() when graceful termination times out
-    mock_process.kill.assert_called_once()
-
-
-def test_terminate_process_forced_shutdown_with_sigkill(process_manager):
-    """Verify terminate_process uses proc.kill() for safe forceful termination.
-
-    Tests that the process termination correctly uses subprocess.kill() for safer
-    forceful termination instead of os.kill().
-
-    Args:
-        process_manager (ProcessManager): Fixture providing a manager.
-    """
-    mock_process = Mock()
-    mock_process.poll.return_value = None
-    mock_process.wait.side_effect = [
-        subprocess.TimeoutExpired(cmd="test", timeout=5),
-        None,  # Second call succeeds after kill()
-    ]
-    mock_process.pid = 12345
-
-    process_manager.terminate_process(mock_process)
-
-    mock_process.poll.assert_called_once()
-    mock_process.terminate.assert_called_once()
-    # Should call wait twice: once with timeout=5, then once with timeout=2
-    expected_calls = [call(timeout=5), call(timeout=2)]
-    mock_process.wait.assert_has_calls(expected_calls)
-    # Should call kill() when graceful termination times out
-    mock_process.kill.assert_called_once()
-
-
-def test_terminate_process_handles_process_lookup_error(process_manager):
-    """Verify terminate_process handles OSError gracefully during kill().
-
-    Tests that the process termination handles race conditions where the process
-    terminates between timeout and kill signal, raising OSError.
-
-    Args:
-        process_manager (ProcessManager): Fixture providing a manager.
-    """
-    mock_process = Mock()
-    mock_process.poll.return_value = None
-    mock_process.wait.side_effect = subprocess.TimeoutExpired(cmd="test", timeout=5)
-    mock_process.kill.side_effect = OSError("No such process")
-    mock_process.pid = 12345
-
-    # This should not raise an exception
-    process_manager.terminate_process(mock_process)
-
-    mock_process.poll.assert_called_once()
-    mock_process.terminate.assert_called_once()
-    mock_process.wait.assert_called_once_with(timeout=5)
-    mock_process.kill.assert_called_once()
-
-
-def test_terminate_process_handles_os_error(process_manager):
-    """Verify terminate_process handles OSError gracefully.
+@pytest.mark.parametrize(
+    "wait_side_effect,kill_side_effect,expected_waits",
+    [
+        # Killed once the grace period runs out
+        (
+            [subprocess.TimeoutExpired(cmd="test", timeout=5), None],
+            None,
+            [call(timeout=5), call(timeout=2)],
+        ),
+        # Exited between the timeout and kill()
+        (
+            subprocess.TimeoutExpired(cmd="test", timeout=5),
+            OSError("No such process"),
+            [call(timeout=5)],
+        ),
+        # Not allowed to signal the process
+        (
+            subprocess.TimeoutExpired(cmd="test", timeout=5),
+            OSError("Operation not permitted"),
+            [call(timeout=5)],
+        ),
+        # Still running after kill()
+        (
+            [
+                subprocess.TimeoutExpired(cmd="test", timeout=5),
+                subprocess.TimeoutExpired(cmd="test", timeout=2),
+            ],
+            None,
+            [call(timeout=5), call(timeout=2)],
+        ),
+    ],
+)
+def test_terminate_process_forced_shutdown(
+    process_manager, wait_side_effect, kill_side_effect, expected_waits
+):
+    """Verify terminate_process kills a process that ignores the grace period.
 
-    Tests that the process termination handles OS-level errors (like permission
-    denied) when trying to send kill signals.
+    Tests that proc.kill() is used once graceful termination times out, and
+    that errors from kill() or a second timeout are swallowed.
 
     Args:
         process_manager (ProcessManager): Fixture providing a manager.
+        wait_side_effect: Side effect for the process's wait() calls.
+        kill_side_effect: Side effect for the process's kill() call.
+        expected_waits (list): Expected wait() calls, in order.
     """
     mock_process = Mock()
     mock_process.poll.return_value = None
-    mock_process.wait.side_effect = subprocess.TimeoutExpired(cmd="test", timeout=5)
-    mock_process.kill.side_effect = OSError("Operation not permitted")
+    mock_process.wait.side_effect = wait_side_effect
+    mock_process.kill.side_effect = kill_side_effect
     mock_process.pid = 12345
 
     # This should not raise an exception
@@ -397,15 +422,13 @@ def test_terminate_process_handles_os_error(process_manager):
 
     mock_process.poll.assert_called_once()
     mock_process.terminate.assert_called_once()
-    mock_process.wait.assert_called_once_with(timeout=5)
+    assert mock_process.wait.call_args_list == expected_waits
     mock_process.kill.assert_called_once()
 
 
-def test_terminate_process_handles_timeout_after_kill(process_manager):
-    """Verify terminate_process handles TimeoutExpired during second wait().
-
-    Tests that the process termination handles cases where the process doesn't
-    terminate even after kill() is called, and the second wait() times out.
+@patch("src.process_manager.TERMINATE_TIMEOUT", 100)
+def test_terminate_process_uses_configured_grace_period(process_manager):
+    """Verify the SIGTERM grace period comes from TERMINATE_TIMEOUT.
 
     Args:
         process_manager (ProcessManager): Fixture providing a manager.
@@ -413,22 +436,17 @@ def test_terminate_process_handles_timeout_after_kill(process_manager):
     mock_process = Mock()
     mock_process.poll.return_value = None
     mock_process.wait.side_effect = [
-        subprocess.TimeoutExpired(cmd="test", timeout=5),
-        subprocess.TimeoutExpired(cmd="test", timeout=2),  # Second wait also times out
+        subprocess.TimeoutExpired(cmd="test", timeout=0.1),
+        None,
     ]
-    mock_process.pid = 12345
 
-    # This should not raise an exception
     process_manager.terminate_process(mock_process)
 
-    mock_process.poll.assert_called_once()
-    mock_process.terminate.assert_called_once()
-    # Should call wait twice: once with timeout=5, then once with timeout=2
-    expected_calls = [call(timeout=5), call(timeout=2)]
-    mock_process.wait.assert_has_calls(expected_calls)
+    assert mock_process.wait.call_args_list == [call(timeout=0.1), call(timeout=2)]
     mock_process.kill.assert_called_once()
 
 
+@pytest.mark.integration
 class TestProcessManagerIntegration:
     """Integration tests for ProcessManager workflow scenarios.
 
@@ -436,18 +454,9 @@ class TestProcessManagerIntegration:
     management workflows including start, restart, and termination sequences.
     """
 
-    @pytest.fixture
-    def manager(self):
-        """Create and return a ProcessManager instance for integration tests.
-
-        Returns:
-            ProcessManager: A new ProcessManager instance for integration testing.
-        """
-        return ProcessManager()
-
     @patch("subprocess.Popen")
     @patch("src.process_manager.logger")
-    def test_full_lifecycle(self, mock_logger, mock_popen, manager):
+    def test_full_lifecycle(self, mock_logger, mock_popen, process_manager):
         """Test the complete lifecycle: start -> restart -> terminate.
 
         Verifies that the process manager correctly handles a complete
@@ -456,7 +465,7 @@ class TestProcessManagerIntegration:
         Args:
             mock_logger (Mock): Mock for logger.
             mock_popen (Mock): Mock for subprocess.Popen.
-            manager (ProcessManager): Fixture providing a manager.
+            process_manager (ProcessManager): Fixture providing a manager.
         """
         # Setup mock processes
         mock_process1 = Mock()
@@ -469,50 +478,52 @@ class TestProcessManagerIntegration:
 
         mock_popen.side_effect = [mock_process1, mock_process2]
 
-        cmd = ["python", "worker.py"]
+        cmd = ["/usr/bin/python", "worker.py"]
 
         # Start process
-        result1 = manager.start_process(cmd)
+        result1 = process_manager.start_process(cmd)
         assert result1 == mock_process1
-        assert manager._worker_process == mock_process1
-        assert manager._worker_cmd == cmd
+        assert process_manager._worker_process == mock_process1
+        assert process_manager._worker_cmd == tuple(cmd)
 
         # Restart process
-        with patch.object(manager, "terminate_process") as mock_terminate:
-            result2 = manager.restart_process()
+        with patch.object(ProcessManager, "_terminate_running") as mock_terminate:
+            result2 = process_manager.restart_process()
             assert result2 == mock_process2
-            assert manager._worker_process == mock_process2
+            assert process_manager._worker_process == mock_process2
             mock_terminate.assert_called_once_with(mock_process1)
 
         # Verify log calls
-        assert mock_logger.info.call_count == 3
-        mock_logger.info.assert_any_call(
-            "Starting worker process with command: python worker.py"
-        )
-        mock_logger.info.assert_any_call("Terminating existing worker process...")
-        mock_logger.info.assert_any_call(
-            "Restarting worker process with command: python worker.py"
-        )
-
-    def test_error_handling_workflow(self, manager):
+        assert mock_logger.info.call_args_list == [
+            call(
+                "Starting worker process with command: %s", "/usr/bin/python worker.py"
+            ),
+            call("Terminating existing worker process..."),
+            call(
+                "Restarting worker process with command: %s",
+                "/usr/bin/python worker.py",
+            ),
+        ]
+
+    def test_error_handling_workflow(self, process_manager):
         """Test error handling for restart without start, is_process_running, and terminate with None.
 
         Verifies that the process manager correctly handles error conditions
         and edge cases in various workflow scenarios.
 
         Args:
-            manager (ProcessManager): Fixture providing a manager.
+            process_manager (ProcessManager): Fixture providing a manager.
         """
         # Test restart without start
         with pytest.raises(ValueError):
-            manager.restart_process()
+            process_manager.restart_process()
 
         # Test is_process_running with no process
-        assert manager.is_process_running() is False
+        assert process_manager.is_process_running() is False
 
         # Test terminate with None process (should not crash)
-        manager.worker_process = None
-        assert manager.is_process_running() is False
+        process_manager._worker_process = None
+        assert process_manager.is_process_running() is False
 
 
 @patch("src.process_manager.logger")
@@ -528,12 +539,18 @@ def test_start_system(mock_logger, process_manager):
     """
     detector_cmd = ["python", "src/detector.py"]
 
-    with patch("src.process_manager.HeartbeatMonitor") as mock_monitor_class:
+    with patch("src.process_manager.HeartbeatMonitor") as mock_monitor_class, patch(
+        "src.process_manager.gc"
+    ) as mock_gc:
         mock_monitor = Mock()
         mock_monitor_class.return_value = mock_monitor
 
         process_manager.start_system(detector_cmd)
 
+        # Verify startup objects were collected and frozen before monitoring
+        mock_gc.collect.assert_called_once_with()
+        mock_gc.freeze.assert_called_once_with()
+
         # Verify monitor was created and configured
         mock_monitor_class.assert_called_once_with(duration=60)
         assert process_manager._monitor == mock_monitor
@@ -560,18 +577,19 @@ def test_shutdown_system(mock_logger, process_manager):
 
     # Set up mock monitor
     mock_monitor = Mock()
-    mock_socket = Mock()
-    mock_monitor._heartbeat_socket = mock_socket
     process_manager._monitor = mock_monitor
 
-    with patch.object(process_manager, "terminate_process") as mock_terminate:
+    with patch.object(ProcessManager, "terminate_processes") as mock_terminate:
         process_manager.shutdown_system()
 
         # Verify process was terminated
-        mock_terminate.assert_called_once_with(mock_worker)
+        mock_terminate.assert_called_once_with([mock_worker])
+
+        # Verify the monitor was closed
+        mock_monitor.close.assert_called_once_with()
 
-        # Verify socket was closed
-        mock_socket.close.assert_called_once()
+    # Verify the shared null device was released
+    assert process_manager._devnull is None
 
 
 @patch("src.process_manager.logger")
@@ -587,19 +605,17 @@ def test_shutdown_system_no_worker(mock_logger, process_manager):
     """
     # Set up mock monitor without worker
     mock_monitor = Mock()
-    mock_socket = Mock()
-    mock_monitor._heartbeat_socket = mock_socket
     process_manager._monitor = mock_monitor
     process_manager._worker_process = None
 
-    with patch.object(process_manager, "terminate_process") as mock_terminate:
+    with patch.object(ProcessManager, "terminate_processes") as mock_terminate:
         process_manager.shutdown_system()
 
         # Verify terminate was not called since no worker
         mock_terminate.assert_not_called()
 
-        # Verify socket was still closed
-        mock_socket.close.assert_called_once()
+        # Verify the monitor was still closed
+        mock_monitor.close.assert_called_once_with()
 
 
 @patch("src.process_manager.logger")
@@ -619,8 +635,296 @@ def test_shutdown_system_no_monitor(mock_logger, process_manager):
     process_manager._worker_process = mock_worker
     process_manager._monitor = None
 
-    with patch.object(process_manager, "terminate_process") as mock_terminate:
+    with patch.object(ProcessManager, "terminate_processes") as mock_terminate:
         process_manager.shutdown_system()
 
         # Verify process was terminated
-        mock_terminate.assert_called_once_with(mock_worker)
+        mock_terminate.assert_called_once_with([mock_worker])
+
+
+@patch("src.process_manager.logger")
+def test_shutdown_system_closes_monitor_when_terminate_fails(
+    mock_logger, process_manager
+):
+    """Verify the monitor and null device are released if termination raises.
+
+    Args:
+        mock_logger (Mock): Mock for logger.
+        process_manager (ProcessManager): Fixture providing a manager.
+    """
+    mock_worker = Mock()
+    mock_worker.poll.return_value = None
+    process_manager._worker_process = mock_worker
+    mock_monitor = Mock()
+    process_manager._monitor = mock_monitor
+
+    with patch.object(
+        ProcessManager, "terminate_processes", side_effect=PermissionError
+    ), pytest.raises(PermissionError):
+        process_manager.shutdown_system()
+
+    mock_monitor.close.assert_called_once_with()
+    assert process_manager._devnull is None
+
+
+@patch("subprocess.Popen")
+def test_spawn_after_shutdown_uses_subprocess_devnull(mock_popen, process_manager):
+    """Test that spawning after shutdown falls back to subprocess.DEVNULL.
+
+    Args:
+        mock_popen (Mock): Mock for subprocess.Popen.
+        process_manager (ProcessManager): Fixture providing a manager.
+    """
+    with patch("src.process_manager.logger"):
+        process_manager.shutdown_system()
+        process_manager.start_process(["/usr/bin/python", "worker.py"])
+
+    mock_popen.assert_called_once_with(
+        ("/usr/bin/python", "worker.py"),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+@patch("subprocess.Popen")
+@patch("src.process_manager.WARM_STANDBY", 1)
+def test_start_process_spawns_standby(mock_popen, process_manager):
+    """Verify a standby worker waiting on a stdin pipe is started with the worker.
+
+    Args:
+        mock_popen (Mock): Mock for subprocess.Popen.
+        process_manager (ProcessManager): Fixture providing a manager.
+    """
+    worker, standby = Mock(), Mock()
+    mock_popen.side_effect = [worker, standby]
+
+    with patch("src.process_manager.logger"):
+        result = process_manager.start_process(["python", "worker.py"])
+
+    assert result is worker
+    assert process_manager._worker_process is worker
+    assert list(process_manager._standbys) == [standby]
+    _, kwargs = mock_popen.call_args
+    assert kwargs["stdin"] == subprocess.PIPE
+    assert kwargs["env"]["DETECTOR_STANDBY"] == "1"
+    assert kwargs["start_new_session"] is True
+
+
+@patch("subprocess.Popen")
+@patch("src.process_manager.WARM_STANDBY", 1)
+def test_restart_process_promotes_standby(mock_popen, process_manager):
+    """Verify restart wakes the standby and starts its replacement.
+
+    Args:
+        mock_popen (Mock): Mock for subprocess.Popen.
+        process_manager (ProcessManager): Fixture providing a manager.
+    """
+    standby, next_standby = Mock(), Mock()
+    process_manager._worker_cmd = ("python", "worker.py")
+    process_manager._standbys.append(standby)
+    mock_popen.return_value = next_standby
+
+    with patch("src.process_manager.logger"):
+        result = process_manager.restart_process()
+
+    assert result is standby
+    assert process_manager._worker_process is standby
+    standby.stdin.write.assert_called_once_with(b"1")
+    standby.stdin.close.assert_called_once_with()
+    mock_popen.assert_called_once()
+    assert list(process_manager._standbys) == [next_standby]
+
+
+@patch("subprocess.Popen")
+def test_restart_process_with_dead_standby(mock_popen, process_manager):
+    """Verify restart spawns a fresh worker when the standby has exited.
+
+    Args:
+        mock_popen (Mock): Mock for subprocess.Popen.
+        process_manager (ProcessManager): Fixture providing a manager.
+    """
+    standby, fresh = Mock(), Mock()
+    standby.stdin.write.side_effect = BrokenPipeError
+    process_manager._worker_cmd = ("python", "worker.py")
+    process_manager._standbys.append(standby)
+    mock_popen.return_value = fresh
+
+    with patch("src.process_manager.logger"):
+        result = process_manager.restart_process()
+
+    assert result is fresh
+    standby.wait.assert_called_once_with()
+    assert not process_manager._standbys
+
+
+@patch("subprocess.Popen")
+@patch("src.process_manager.WARM_STANDBY", 2)
+def test_restart_process_skips_dead_standby_in_pool(mock_popen, process_manager):
+    """Verify restart promotes the next live standby and refills the pool.
+
+    Args:
+        mock_popen (Mock): Mock for subprocess.Popen.
+        process_manager (ProcessManager): Fixture providing a manager.
+    """
+    dead, live, refill = Mock(), Mock(), Mock()
+    dead.stdin.write.side_effect = BrokenPipeError
+    process_manager._worker_cmd = ("python", "worker.py")
+    process_manager._standbys.extend([dead, live])
+    mock_popen.return_value = refill
+
+    with patch("src.process_manager.logger"):
+        result = process_manager.restart_process()
+
+    assert result is live
+    dead.wait.assert_called_once_with()
+    assert mock_popen.call_count == 2
+    assert list(process_manager._standbys) == [refill, refill]
+
+
+def test_shutdown_system_retires_standby(process_manager):
+    """Verify shutdown closes the standby's pipe and terminates it.
+
+    Args:
+        process_manager (ProcessManager): Fixture providing a manager.
+    """
+    standby = Mock()
+    process_manager._standbys.append(standby)
+
+    with patch("src.process_manager.logger"), patch.object(
+        ProcessManager, "terminate_processes"
+    ) as mock_terminate:
+        process_manager.shutdown_system()
+
+    standby.stdin.close.assert_called_once_with()
+    mock_terminate.assert_called_once_with([standby])
+    assert not process_manager._standbys
+
+
+def test_terminate_processes_kills_stuck_processes(process_manager):
+    """Verify processes that outlive the grace period are killed.
+
+    Args:
+        process_manager (ProcessManager): Fixture providing a manager.
+    """
+    graceful, stuck, exited = Mock(), Mock(), Mock()
+    graceful.poll.return_value = None
+    stuck.poll.return_value = None
+    stuck.wait.side_effect = [subprocess.TimeoutExpired("cmd", 5), 0]
+    exited.poll.return_value = 0
+
+    process_manager.terminate_processes([graceful, stuck, exited])
+
+    graceful.terminate.assert_called_once_with()
+    graceful.kill.assert_not_called()
+    stuck.terminate.assert_called_once_with()
+    stuck.kill.assert_called_once_with()
+    exited.terminate.assert_not_called()
+
+
+def test_terminate_processes_without_select_poll(process_manager, monkeypatch):
+    """Verify terminate_processes works where select.poll is missing (Windows).
+
+    Args:
+        process_manager (ProcessManager): Fixture providing a manager.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.delattr("src.process_manager.select.poll")
+    proc = Mock()
+    proc.poll.return_value = None
+
+    process_manager.terminate_processes([proc])
+
+    proc.terminate.assert_called_once_with()
+    proc.wait.assert_called_once()
+    proc.kill.assert_not_called()
+
+
+def test_fill_standbys_skips_env_copy_when_full(process_manager, monkeypatch):
+    """Verify a full or disabled standby pool does not copy the environment.
+
+    Args:
+        process_manager (ProcessManager): Fixture providing a manager.
+        monkeypatch: Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr("src.process_manager.WARM_STANDBY", 0)
+
+    with patch("src.process_manager.os") as mock_os, patch(
+        "subprocess.Popen"
+    ) as mock_popen:
+        process_manager._fill_standbys(["python", "worker.py"])
+
+    mock_popen.assert_not_called()
+    assert mock_os.mock_calls == []
+
+
+@pytest.fixture
+def sleeping_process():
+    """Start a real child process that sleeps until it is terminated.
+
+    Yields:
+        subprocess.Popen: The running child process.
+    """
+    proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    try:
+        yield proc
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="Requires pidfd support")
+def test_terminate_process_waits_on_pidfd(
+    monkeypatch, process_manager, sleeping_process
+):
+    """Verify a real process is terminated and reaped through its pidfd.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        process_manager (ProcessManager): Fixture providing a manager.
+        sleeping_process (subprocess.Popen): Running child process.
+    """
+    monkeypatch.setattr("src.process_manager._pidfd_open", os.pidfd_open)
+
+    process_manager.terminate_process(sleeping_process)
+
+    assert sleeping_process.returncode is not None
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="Requires pidfd support")
+def test_wait_for_exit_times_out_on_pidfd(monkeypatch, sleeping_process):
+    """Verify a pidfd wait on a live process raises TimeoutExpired.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        sleeping_process (subprocess.Popen): Running child process.
+    """
+    monkeypatch.setattr("src.process_manager._pidfd_open", os.pidfd_open)
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        _wait_for_exit(sleeping_process, 0.05)
+
+    assert sleeping_process.poll() is None
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="Requires pidfd support")
+def test_terminate_processes_waits_on_pidfds(monkeypatch, process_manager):
+    """Verify several real processes are terminated and reaped together.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+        process_manager (ProcessManager): Fixture providing a manager.
+    """
+    monkeypatch.setattr("src.process_manager._pidfd_open", os.pidfd_open)
+    procs = [
+        subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        for _ in range(3)
+    ]
+    try:
+        process_manager.terminate_processes(procs)
+
+        assert all(proc.returncode is not None for proc in procs)
+    finally:
+        for proc in procs:
+            proc.kill()
+            proc.wait()